@@ -1,6 +1,8 @@
+import html
+import re
 import sublime
 import sublime_plugin
-from .lib import util, pantone
+from .lib import util, pantone, colorindex
 
 TEMPLATE = '''
     <body id="inline-color-hint">
@@ -15,68 +17,357 @@ TEMPLATE = '''
     </body>
 '''
 
+SIMULATION_TEMPLATE = '''
+    <body id="simulated-color-hint">
+        <style>
+            div.color-box {{
+                padding: 0 .3em;
+                border: 1px solid var(--foreground);
+                background-color: {color};
+                color: {label_color};
+                font-size: .8em;
+            }}
+        </style>
+        <div class="color-box">{label}</div>
+    </body>
+'''
+
+NEAREST_TEMPLATE = '''
+    <body id="nearest-color-hint">
+        <style>
+            span.delta-e {{
+                color: color(var(--foreground) alpha(0.6));
+            }}
+        </style>
+        {colors}
+    </body>
+'''
+
+# How far around the cursor to look for colors on (minified) long lines
+LINE_REACH = 1000
+# Buffers larger than this are indexed a chunk at a time, between the other tasks of the async thread
+INDEX_CHUNK = 1 << 15
+# Where a chunk can end, no color holds a line break or a CSS delimiter
+CHUNK_END_RE = re.compile(r'[\n;{}]')
+
+manual_phantom_sets = {}
+live_phantom_sets = {}
+
 
 def plugin_loaded():
-    pantone.load()
+    # Pantone books load in the background on first use
+    pantone.add_ready_callback(pantone_loaded)
+    settings = sublime.load_settings('ColorHints.sublime-settings')
+    settings.add_on_change('ColorHints', apply_settings)
+    apply_settings()
+
+
+def plugin_unloaded():
+    pantone.remove_ready_callback(pantone_loaded)
+    settings = sublime.load_settings('ColorHints.sublime-settings')
+    settings.clear_on_change('ColorHints')
+
+
+def apply_settings():
+    settings = sublime.load_settings('ColorHints.sublime-settings')
+    util.color_cache.resize(settings.get('color_cache_size', 1024))
+    if pantone.select_books(settings.get('pantone_books', pantone.pantone_books)):
+        sublime.set_timeout_async(pantone_books_changed)
+
+
+def pantone_loaded():
+    # called from the loader thread, the color indexes are only touched on the async thread
+    sublime.set_timeout_async(refresh_live_hints)
+
+
+def pantone_books_changed():
+    # drop colors translated with the previous books, the new books translate them once loaded
+    util.color_cache.clear()
+    for index in colorindex.indexes.values():
+        index.unresolve_pantone()
+    if any(index.has_pending() for index in colorindex.indexes.values()):
+        pantone.load_async()
+    for phantom_set in list(live_phantom_sets.values()):
+        update_live_hints(phantom_set.view, phantom_set)
+
+
+def refresh_live_hints():
+    """Render the live hints again, translating the Pantone colors that were pending."""
+
+    resolved = set()
+    for phantom_set in list(live_phantom_sets.values()):
+        view = phantom_set.view
+        index = update_index(view)
+        if index.change_count == view.change_count():
+            index.resolve(text_reader(view))
+            resolved.add(view.buffer_id())
+    # an index without live hints is resolved by scanning it again on its next use
+    for buffer_id, index in colorindex.indexes.items():
+        if buffer_id not in resolved and index.has_pending():
+            index.invalidate()
+    for phantom_set in list(live_phantom_sets.values()):
+        update_live_hints(phantom_set.view, phantom_set)
+
+
+def get_options(view, point):
+    """Get the `argb_hex` setting and the color formats enabled at the point."""
+
+    settings = sublime.load_settings('ColorHints.sublime-settings')
+    formats = util.ALL_FORMATS
+    for selector, families in settings.get('color_formats', {}).items():
+        if view.match_selector(point, selector):
+            formats = frozenset(families)
+            break
+    return settings.get('argb_hex', False), formats
 
 
 def get_cursor_color(view, region):
     """Get cursor color."""
 
-    color = None
-    alpha = None
-    alpha_dec = None
-    settings = sublime.load_settings('ColorHints.sublime-settings')
-    argb = settings.get('argb_hex', False)
     point = region.begin()
-    visible = view.visible_region()
-    start = point - 50
-    end = point + 50
-    if start < visible.begin():
-        start = visible.begin()
-    if end > visible.end():
-        end = visible.end()
-    bfr = view.substr(sublime.Region(start, end))
-    ref = point - start
-    for m in util.COLOR_RE.finditer(bfr):
-        if ref >= m.start(0) and ref < m.end(0):
-            color, alpha, alpha_dec = util.translate_color(m, argb)
-            break
-    return color, alpha, alpha_dec
+    options = get_options(view, point)
+    index = colorindex.indexes.get(view.buffer_id())
+    if index is not None and index.is_current(view.change_count(), options):
+        return index.lookup(point)
+    # colors only span the lines a functional color is left open over, only very long lines need a bound
+    start, end = expand_lines(view, point, point, options[1])
+    start = max(start, point - LINE_REACH)
+    end = min(end, point + LINE_REACH)
+    m = util.find_color_at(view.substr(sublime.Region(start, end)), point - start, options[1])
+    if m is not None:
+        return util.translate_color(m, options[0])
+    return None
+
+
+def joined(view, point):
+    """Check if the line at the point is joined to the one before, like `util.split_lines` does."""
 
+    start = point
+    for _ in range(util.FUNCTION_LINES):
+        if start > 0:
+            start = view.line(start - 1).begin()
+    return util.OPEN_FUNCTION_RE.search(view.substr(sublime.Region(start, point - 1))) is not None
 
-def render_hints(view, phantom_set, rule):
+
+def expand_lines(view, begin, end, formats):
+    """Widen a range to full lines, and to the lines a functional color is left open over, like `util.split_lines`."""
+
+    lines = view.full_line(sublime.Region(begin, end))
+    begin, end = lines.begin(), lines.end()
+    if 'functional' in formats:
+        while begin > 0 and joined(view, begin):
+            begin = view.line(begin - 1).begin()
+        while end < view.size() and joined(view, end):
+            end = view.full_line(end).end()
+    return begin, end
+
+
+def text_reader(view):
+    """Get a function returning the text of a range of the view."""
+
+    def read(begin, end):
+        return view.substr(sublime.Region(begin, end))
+
+    return read
+
+
+def update_index(view):
+    """Bring the buffer's color index up to date, it is left invalidated when the buffer changed meanwhile."""
+
+    # the index covers the whole buffer, so it uses the formats of the syntax's main scope
+    options = get_options(view, 0)
+
+    def expand(begin, end):
+        return expand_lines(view, begin, end, options[1])
+
+    index = colorindex.get(view.buffer_id())
+    change_count = view.change_count()
+    if not index.is_current(change_count, options):
+        if not index.catch_up(change_count, options, text_reader(view), expand):
+            if view.size() > INDEX_CHUNK:
+                # until the index is built, cursors are looked up on their line
+                if not index.building(change_count, options):
+                    index.start_build(change_count, options)
+                    sublime.set_timeout_async(lambda: build_index(view, index, change_count, options))
+                return index
+            index.rebuild(view.substr(sublime.Region(0, view.size())), change_count, options)
+        if view.change_count() != change_count:
+            # the text we read may already hold edits that are still queued
+            index.invalidate()
+    return index
+
+
+def build_index(view, index, change_count, options):
+    """Scan the next chunk of a chunked rebuild of the buffer's color index, scheduling the chunk after it."""
+
+    if not index.building(change_count, options):
+        # a later rebuild took over
+        return
+    if view.change_count() != change_count or colorindex.indexes.get(view.buffer_id()) is not index:
+        # the next lookup starts over
+        index.build = None
+        return
+    offset = index.build[2]
+    size = view.size()
+    end = offset + INDEX_CHUNK
+    if end < size:
+        # end the chunk after a line break or delimiter, on the rare line without one nearby anywhere
+        m = CHUNK_END_RE.search(view.substr(sublime.Region(end, min(end + LINE_REACH, size))))
+        if m is not None:
+            end += m.end()
+            if m.group(0) == '\n':
+                # not amid the lines of a functional color
+                end = expand_lines(view, end, end, options[1])[1]
+    end = min(end, size)
+    index.build_chunk(view.substr(sublime.Region(offset, end)), end == size)
+    if end < size:
+        sublime.set_timeout_async(lambda: build_index(view, index, change_count, options))
+    elif index.has_pending() and pantone.ready.is_set():
+        # the books loaded while the chunks were scanned
+        index.resolve(text_reader(view))
+
+
+def get_indexed_color(view, region):
+    """Get cursor color from the buffer's color index, bringing the index up to date first."""
+
+    update_index(view)
+    # where other formats apply than at the start of the buffer, like CSS in HTML, the line is searched instead
+    return get_cursor_color(view, region)
+
+
+def clear_manual_hints(view, edits):
+    """Erase the manual hints on lines touched by the given edits."""
+
+    phantom_set = manual_phantom_sets.get(view.id())
+    if phantom_set is None or not phantom_set.phantoms:
+        return
+    ranges = colorindex.touched(edits)
+    regions = view.query_phantoms([p.id for p in phantom_set.phantoms])
+    keep = []
+    for phantom, region in zip(phantom_set.phantoms, regions):
+        line = view.line(region)
+        if not any(line.begin() <= end and begin <= line.end() for begin, end in ranges):
+            keep.append(phantom)
+    if len(keep) != len(phantom_set.phantoms):
+        phantom_set.update(keep)
+
+
+def nearest_colors(color, catalogs):
+    """Describe the nearest color of each catalog, an empty string if there is none yet."""
+
+    if not catalogs:
+        return ''
+    # imported on first use, as it loads NumPy when available
+    from .lib import nearest
+
+    found = []
+    for catalog in catalogs:
+        if catalog in util.CATALOG_MODULES:
+            for delta_e, label, _ in nearest.nearest(color >> 8, catalog):
+                found.append('%s <span class="delta-e">ΔE %.1f</span>' % (html.escape(label), delta_e))
+    return ' · '.join(found)
+
+
+def simulated_colors(color, kinds):
+    """Render the color as seen with each color vision deficiency."""
+
+    if not kinds:
+        return []
+    # imported on first use, like the nearest colors
+    from .lib import colorblind, rgba
+
+    boxes = []
+    for kind in kinds:
+        if kind in colorblind.SIMULATIONS:
+            simulated = colorblind.simulate(color, kind)
+            boxes.append(SIMULATION_TEMPLATE.format(
+                color=util.hex_rgb(simulated),
+                label_color='#000' if rgba.RGBA.from_packed(simulated).get_luminance() >= 128 else '#fff',
+                label=kind[0].upper()
+            ))
+    return boxes
+
+
+def render_hints(view, phantom_set, rule, lookup=get_cursor_color):
     # render hints accoring to a rule, ie. always, or only in a certain scope
+    settings = sublime.load_settings('ColorHints.sublime-settings')
+    catalogs = settings.get('nearest_colors', [])
+    simulations = settings.get('colorblind_hints', [])
     sels = view.sel()
     ps = []
     for sel in sels:
         if rule == 'always' or view.match_selector(sel.b, rule):
-            color = get_cursor_color(view, sel)
-            if color[0] is not None:
+            color = lookup(view, sel)
+            if color is not None and color is not util.UNRESOLVED:
                 line_end = view.line(sel).end()
                 region = sublime.Region(line_end, line_end)
                 ps.append(sublime.Phantom(
                         region,
-                        TEMPLATE.format(color=color[0]),
+                        TEMPLATE.format(color=util.hex_rgb(color)),
                         sublime.LAYOUT_INLINE))
+                for box in simulated_colors(color, simulations):
+                    ps.append(sublime.Phantom(region, box, sublime.LAYOUT_INLINE))
+                colors = nearest_colors(color, catalogs)
+                if colors:
+                    ps.append(sublime.Phantom(region, NEAREST_TEMPLATE.format(colors=colors), sublime.LAYOUT_BELOW))
 
     phantom_set.update(ps)
 
 
+def update_live_hints(view, phantom_set):
+    settings = sublime.load_settings('ColorHints.sublime-settings')
+    rule = settings.get('live_hints', 'always')
+    if rule != 'never':
+        render_hints(view, phantom_set, rule, get_indexed_color)
+
+
 class ManualColorHint(sublime_plugin.TextCommand):
 
     def __init__(self, view):
         self.view = view
         self.phantom_set = sublime.PhantomSet(view, 'manual_color_hints')
+        manual_phantom_sets[view.id()] = self.phantom_set
 
     def run(self, paths):
         render_hints(self.view, self.phantom_set, 'always')
 
 
-class ClearManualColorHints(sublime_plugin.ViewEventListener):
+class PantoneBookStats(sublime_plugin.WindowCommand):
+
+    def run(self):
+        # the books may still have to load, wait for them off the UI thread
+        pantone.load_async()
+        sublime.set_timeout_async(self.report)
 
-    def on_modified_async(self):
-        self.view.erase_phantoms('manual_color_hints')
+    def report(self):
+        pantone.ready.wait()
+        lines = ['%-40s %-12s %8s %10s %10s' % ('Book', 'Source', 'Entries', 'Load ms', 'Memory KB')]
+        for book in pantone.stats:
+            lines.append('%-40s %-12s %8d %10.1f %10.1f' % (
+                book.book, book.source, book.entries, book.seconds * 1000, book.memory / 1024
+            ))
+        loaded = [book.book for book in pantone.stats]
+        for book in pantone.selected_books:
+            if book not in loaded:
+                lines.append('%-40s not found' % book)
+        lines.append('')
+        lines.append('Books from %s share its load time.' % pantone.CATALOG)
+        panel = self.window.create_output_panel('pantone_book_stats')
+        panel.run_command('append', {'characters': '\n'.join(lines) + '\n'})
+        self.window.run_command('show_panel', {'panel': 'output.pantone_book_stats'})
+
+
+class ColorIndexListener(sublime_plugin.TextChangeListener):
+
+    def on_text_changed(self, changes):
+        # runs on the UI thread, so only queue the edits for the color index
+        edits = [(change.a.pt, change.b.pt, len(change.str)) for change in changes]
+        view = self.buffer.primary_view()
+        index = colorindex.indexes.get(self.buffer.id())
+        if index is not None:
+            index.record(edits, view.change_count())
+        for view in self.buffer.views():
+            clear_manual_hints(view, edits)
 
 
 class ShowColorHints(sublime_plugin.ViewEventListener):
@@ -84,9 +375,12 @@ class ShowColorHints(sublime_plugin.ViewEventListener):
     def __init__(self, view):
         self.view = view
         self.phantom_set = sublime.PhantomSet(view, 'color_hints')
+        live_phantom_sets[view.id()] = self.phantom_set
 
     def on_selection_modified_async(self):
-        settings = sublime.load_settings('ColorHints.sublime-settings')
-        rule = settings.get('live_hints', 'always')
-        if settings.get('live_hints') != 'never':
-            render_hints(self.view, self.phantom_set, rule)
+        update_live_hints(self.view, self.phantom_set)
+
+    def on_close(self):
+        colorindex.discard(self.view.buffer_id())
+        manual_phantom_sets.pop(self.view.id(), None)
+        live_phantom_sets.pop(self.view.id(), None)
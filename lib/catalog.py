@@ -0,0 +1,127 @@
+"""
+Color catalogs.
+
+CSS names, RAL codes and Pantone codes share one interface. Keys are
+normalized once when a catalog loads, lower case with single spaces, and
+kept in one dict of packed `0xRRGGBB` colors, in key order. A lookup probes
+the key in lower case, how keys are mostly written, and only normalizes a
+key written some other way. A catalog loads on first use, can look keys up
+by color, and reports its size and load time.
+"""
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+# Returned by lookups of a catalog that is still loading
+PENDING = object()
+
+# A catalog's name, number of keys, the seconds loading took and the bytes it keeps
+CatalogStats = namedtuple('CatalogStats', ['name', 'entries', 'seconds', 'memory'])
+
+
+def normalize(key):
+    """Get the lookup form of a key, lower case with runs of whitespace as one space."""
+
+    return ' '.join(key.lower().split())
+
+
+class ColorCatalog(object):
+    """A lazily loaded catalog of keys to packed colors."""
+
+    def __init__(self, name, source, label=None):
+        """Define a catalog by its name, a function returning its `(key, color)` pairs, and how to label a key."""
+
+        self.name = name
+        self.source = source
+        self.label = label if label is not None else str
+        self.colors = None
+        self.seconds = 0.0
+        # keys by color, as colors in order and the index of their key, with the version they were built for
+        self.reverse = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Load the colors, unless they are loaded."""
+
+        with self.lock:
+            if self.colors is None:
+                start = time.perf_counter()
+                colors = sorted(((normalize(key), color) for key, color in self.source()), key=lambda item: item[0])
+                self.colors = dict(colors)
+                self.source = None
+                self.seconds = time.perf_counter() - start
+        return self.colors
+
+    def available(self):
+        """Check the colors can be used without waiting, starting to load them when they can't."""
+
+        return True
+
+    def version(self):
+        """Get the version of the colors, it changes when they are loaded again."""
+
+        return 0
+
+    def __len__(self):
+        """Get the number of keys."""
+
+        return len(self.load())
+
+    def get(self, key, default=None):
+        """Get the packed color of a key."""
+
+        colors = self.colors
+        if colors is None:
+            colors = self.load()
+        color = colors.get(key.lower())
+        if color is None:
+            color = colors.get(normalize(key), default)
+        return color
+
+    def hex(self, key):
+        """Get the CSS hex of a key, `None` if it is missing or `PENDING` while loading."""
+
+        color = self.get(key)
+        return '#%06x' % color if isinstance(color, int) else color
+
+    def items(self):
+        """Iterate the normalized keys and their colors."""
+
+        return self.load().items()
+
+    def labeled(self):
+        """Get the `(label, color)` pairs."""
+
+        return [(self.label(key), color) for key, color in self.items()]
+
+    def keys_of(self, color):
+        """Get the normalized keys of a packed color, in key order."""
+
+        reverse = self.reverse
+        if reverse is None or reverse[0] != self.version():
+            items = list(self.items())
+            order = sorted(range(len(items)), key=lambda i: (items[i][1], i))
+            reverse = self.reverse = (
+                self.version(), [items[i][0] for i in order], array('I', [items[i][1] for i in order])
+            )
+        _, keys, colors = reverse
+        i = bisect_left(colors, color)
+        found = []
+        while i < len(colors) and colors[i] == color:
+            found.append(keys[i])
+            i += 1
+        return found
+
+    def memory(self):
+        """Get the bytes the colors take."""
+
+        colors = self.load()
+        return sys.getsizeof(colors) + sum(sys.getsizeof(key) + sys.getsizeof(color) for key, color in colors.items())
+
+    def stats(self):
+        """Get the size and load time of the catalog."""
+
+        return CatalogStats(self.name, len(self), self.seconds, self.memory())
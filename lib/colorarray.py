@@ -0,0 +1,332 @@
+"""
+Color math on arrays.
+
+Converts batches of packed colors to CIELAB and measures CIE76 and
+CIEDE2000 color differences between batches. A batch of Lab colors is a
+flat sequence of `L, a, b` triples. Columns of HSL, HSV or HWB channels
+convert to batches of packed `0xRRGGBB` colors, exactly like `RGBA` would
+convert them one by one. With NumPy the work is vectorized and batches
+are NumPy arrays, without it the same math runs in plain Python over
+`array` batches.
+"""
+from array import array
+from colorsys import hls_to_rgb, hsv_to_rgb
+from math import atan2, cos, degrees, exp, radians, sin, sqrt
+from .rgba import clamp, round_int
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ONE_SIXTH = 1.0 / 6.0
+TWO_THIRD = 2.0 / 3.0
+ONE_THIRD = 1.0 / 3.0
+
+# D65 reference white
+WHITE_X = 0.95047
+WHITE_Z = 1.08883
+
+# Linear light of every 8 bit sRGB channel value
+LINEAR = [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in (i / 255.0 for i in range(256))]
+
+# Linear sRGB to XYZ, rows scaled by the reference white
+XYZ = (
+    (0.4124564 / WHITE_X, 0.3575761 / WHITE_X, 0.1804375 / WHITE_X),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339 / WHITE_Z, 0.1191920 / WHITE_Z, 0.9503041 / WHITE_Z)
+)
+
+EPSILON = 216.0 / 24389.0
+KAPPA = 24389.0 / 27.0
+POW25_7 = 25.0 ** 7
+
+
+def lab_f(t):
+    """Apply the CIELAB companding function."""
+
+    return t ** (1.0 / 3.0) if t > EPSILON else (KAPPA * t + 16.0) / 116.0
+
+
+def rgb_to_lab(color):
+    """Convert a packed `0xRRGGBB` color to CIELAB under D65."""
+
+    r = LINEAR[color >> 16 & 0xFF]
+    g = LINEAR[color >> 8 & 0xFF]
+    b = LINEAR[color & 0xFF]
+    (xr, xg, xb), (yr, yg, yb), (zr, zg, zb) = XYZ
+    fx = lab_f(xr * r + xg * g + xb * b)
+    fy = lab_f(yr * r + yg * g + yb * b)
+    fz = lab_f(zr * r + zg * g + zb * b)
+    return 116.0 * fy - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)
+
+
+def to_lab(colors):
+    """Convert packed `0xRRGGBB` colors to a batch of CIELAB colors."""
+
+    if numpy is not None:
+        colors = numpy.asarray(colors, dtype=numpy.uint32)
+        linear = numpy.array(LINEAR)
+        rgb = numpy.stack([linear[colors >> 16 & 0xFF], linear[colors >> 8 & 0xFF], linear[colors & 0xFF]], axis=-1)
+        xyz = rgb @ numpy.array(XYZ).T
+        f = numpy.where(xyz > EPSILON, numpy.cbrt(xyz), (KAPPA * xyz + 16.0) / 116.0)
+        lab = numpy.stack([116.0 * f[:, 1] - 16.0, 500.0 * (f[:, 0] - f[:, 1]), 200.0 * (f[:, 1] - f[:, 2])], axis=-1)
+        return lab.ravel()
+    lab = array('d')
+    for color in colors:
+        lab.extend(rgb_to_lab(color))
+    return lab
+
+
+def to_array(lab):
+    """Get a batch as `array('d')`."""
+
+    if numpy is not None and isinstance(lab, numpy.ndarray):
+        return array('d', lab.astype(numpy.float64).tobytes())
+    return lab if isinstance(lab, array) else array('d', lab)
+
+
+def _pairs(lab1, lab2):
+    """Iterate the Lab colors of two batches pairwise, a batch of one color pairs with every color of the other."""
+
+    n1 = len(lab1) // 3
+    n2 = len(lab2) // 3
+    for i in range(max(n1, n2)):
+        j1 = 0 if n1 == 1 else i * 3
+        j2 = 0 if n2 == 1 else i * 3
+        yield lab1[j1], lab1[j1 + 1], lab1[j1 + 2], lab2[j2], lab2[j2 + 1], lab2[j2 + 2]
+
+
+def delta_e76(lab1, lab2):
+    """
+    Get the CIE76 differences between two batches of Lab colors.
+
+    The batches pair up color by color, a batch of one color is compared to every color of the other.
+    """
+
+    if numpy is not None:
+        lab1 = numpy.asarray(lab1, dtype=numpy.float64).reshape(-1, 3)
+        lab2 = numpy.asarray(lab2, dtype=numpy.float64).reshape(-1, 3)
+        return numpy.sqrt(((lab1 - lab2) ** 2).sum(axis=-1))
+    return array('d', [
+        sqrt((l1 - l2) ** 2 + (a1 - a2) ** 2 + (b1 - b2) ** 2) for l1, a1, b1, l2, a2, b2 in _pairs(lab1, lab2)
+    ])
+
+
+def _delta_e2000(l1, a1, b1, l2, a2, b2):
+    """Get the CIEDE2000 difference of two Lab colors."""
+
+    c1 = sqrt(a1 * a1 + b1 * b1)
+    c2 = sqrt(a2 * a2 + b2 * b2)
+    c = ((c1 + c2) / 2.0) ** 7
+    g = 0.5 * (1.0 - sqrt(c / (c + POW25_7)))
+    a1 *= 1.0 + g
+    a2 *= 1.0 + g
+    c1 = sqrt(a1 * a1 + b1 * b1)
+    c2 = sqrt(a2 * a2 + b2 * b2)
+    h1 = degrees(atan2(b1, a1)) % 360.0 if c1 else 0.0
+    h2 = degrees(atan2(b2, a2)) % 360.0 if c2 else 0.0
+
+    dl = l2 - l1
+    dc = c2 - c1
+    if c1 * c2 == 0.0:
+        dh = 0.0
+        h = h1 + h2
+    else:
+        dh = h2 - h1
+        h = (h1 + h2) / 2.0
+        if dh > 180.0:
+            dh -= 360.0
+        elif dh < -180.0:
+            dh += 360.0
+        if abs(h1 - h2) > 180.0:
+            h += 180.0 if h1 + h2 < 360.0 else -180.0
+    dh = 2.0 * sqrt(c1 * c2) * sin(radians(dh) / 2.0)
+
+    lm = (l1 + l2) / 2.0 - 50.0
+    c = (c1 + c2) / 2.0
+    t = (
+        1.0 - 0.17 * cos(radians(h - 30.0)) + 0.24 * cos(radians(2.0 * h)) +
+        0.32 * cos(radians(3.0 * h + 6.0)) - 0.20 * cos(radians(4.0 * h - 63.0))
+    )
+    sl = 1.0 + 0.015 * lm * lm / sqrt(20.0 + lm * lm)
+    sc = 1.0 + 0.045 * c
+    sh = 1.0 + 0.015 * c * t
+    c7 = c ** 7
+    rt = -2.0 * sqrt(c7 / (c7 + POW25_7)) * sin(radians(60.0 * exp(-((h - 275.0) / 25.0) ** 2)))
+    dl /= sl
+    dc /= sc
+    dh /= sh
+    return sqrt(dl * dl + dc * dc + dh * dh + rt * dc * dh)
+
+
+def _delta_e2000_numpy(lab1, lab2):
+    """Get the CIEDE2000 differences of two batches of Lab colors with NumPy."""
+
+    np = numpy
+    lab1 = np.asarray(lab1, dtype=np.float64).reshape(-1, 3)
+    lab2 = np.asarray(lab2, dtype=np.float64).reshape(-1, 3)
+    l1, a1, b1 = lab1[:, 0], lab1[:, 1], lab1[:, 2]
+    l2, a2, b2 = lab2[:, 0], lab2[:, 1], lab2[:, 2]
+
+    c = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2.0) ** 7
+    g = 0.5 * (1.0 - np.sqrt(c / (c + POW25_7)))
+    a1 = a1 * (1.0 + g)
+    a2 = a2 * (1.0 + g)
+    c1 = np.hypot(a1, b1)
+    c2 = np.hypot(a2, b2)
+    h1 = np.where(c1 != 0.0, np.degrees(np.arctan2(b1, a1)) % 360.0, 0.0)
+    h2 = np.where(c2 != 0.0, np.degrees(np.arctan2(b2, a2)) % 360.0, 0.0)
+
+    dl = l2 - l1
+    dc = c2 - c1
+    chroma = c1 * c2 != 0.0
+    dh = h2 - h1
+    dh = np.where(dh > 180.0, dh - 360.0, np.where(dh < -180.0, dh + 360.0, dh))
+    dh = np.where(chroma, dh, 0.0)
+    h = (h1 + h2) / 2.0
+    h = np.where(np.abs(h1 - h2) > 180.0, np.where(h1 + h2 < 360.0, h + 180.0, h - 180.0), h)
+    h = np.where(chroma, h, h1 + h2)
+    dh = 2.0 * np.sqrt(c1 * c2) * np.sin(np.radians(dh) / 2.0)
+
+    lm = (l1 + l2) / 2.0 - 50.0
+    c = (c1 + c2) / 2.0
+    t = (
+        1.0 - 0.17 * np.cos(np.radians(h - 30.0)) + 0.24 * np.cos(np.radians(2.0 * h)) +
+        0.32 * np.cos(np.radians(3.0 * h + 6.0)) - 0.20 * np.cos(np.radians(4.0 * h - 63.0))
+    )
+    sl = 1.0 + 0.015 * lm * lm / np.sqrt(20.0 + lm * lm)
+    sc = 1.0 + 0.045 * c
+    sh = 1.0 + 0.015 * c * t
+    c7 = c ** 7
+    rt = -2.0 * np.sqrt(c7 / (c7 + POW25_7)) * np.sin(np.radians(60.0 * np.exp(-((h - 275.0) / 25.0) ** 2)))
+    dl = dl / sl
+    dc = dc / sc
+    dh = dh / sh
+    return np.sqrt(dl * dl + dc * dc + dh * dh + rt * dc * dh)
+
+
+def delta_e2000(lab1, lab2):
+    """
+    Get the CIEDE2000 differences between two batches of Lab colors.
+
+    The batches pair up color by color, a batch of one color is compared to every color of the other.
+    """
+
+    if numpy is not None:
+        return _delta_e2000_numpy(lab1, lab2)
+    return array('d', [_delta_e2000(*pair) for pair in _pairs(lab1, lab2)])
+
+
+def pack_rgb(r, g, b):
+    """Pack RGB floats (0-1) as `0xRRGGBB`, rounded like `RGBA` rounds them."""
+
+    return (
+        clamp(round_int(r * 255.0), 0, 255) << 16 | clamp(round_int(g * 255.0), 0, 255) << 8 |
+        clamp(round_int(b * 255.0), 0, 255)
+    )
+
+
+def _pack_rgb_numpy(r, g, b):
+    """Pack columns of RGB floats (0-1) as `0xRRGGBB`, rounding halves away from zero like `round_int`."""
+
+    np = numpy
+    channels = []
+    for c in (r, g, b):
+        c = c * 255.0
+        whole = np.floor(c)
+        # negative values clamp to 0 anyway, the rounding only matters above it
+        channels.append(np.clip(whole + (c - whole >= 0.5), 0, 255).astype(np.uint32))
+    return channels[0] << 16 | channels[1] << 8 | channels[2]
+
+
+def _columns(*columns):
+    """Get columns as float64 NumPy arrays of one shape."""
+
+    return numpy.broadcast_arrays(*[numpy.asarray(c, dtype=numpy.float64) for c in columns])
+
+
+def _hue_channel_numpy(m1, m2, hue):
+    """Get one channel of `colorsys.hls_to_rgb` for columns."""
+
+    np = numpy
+    hue = np.mod(hue, 1.0)
+    return np.where(
+        hue < ONE_SIXTH, m1 + (m2 - m1) * hue * 6.0,
+        np.where(hue < 0.5, m2, np.where(hue < TWO_THIRD, m1 + (m2 - m1) * (TWO_THIRD - hue) * 6.0, m1))
+    )
+
+
+def _hsv_to_rgb_numpy(h, s, v):
+    """Run `colorsys.hsv_to_rgb` on columns."""
+
+    np = numpy
+    i = np.trunc(h * 6.0)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = np.mod(i.astype(np.int64), 6)
+    gray = s == 0.0
+    r = np.where(gray, v, np.choose(i, [v, q, p, p, t, v]))
+    g = np.where(gray, v, np.choose(i, [t, v, v, q, p, p]))
+    b = np.where(gray, v, np.choose(i, [p, p, t, v, v, q]))
+    return r, g, b
+
+
+def from_hls(h, lum, s):
+    """Convert columns of hue (0-1), lightness and saturation to packed `0xRRGGBB` colors, like `RGBA.fromhls`."""
+
+    if numpy is not None:
+        h, lum, s = _columns(h, lum, s)
+        m2 = numpy.where(lum <= 0.5, lum * (1.0 + s), lum + s - (lum * s))
+        m1 = 2.0 * lum - m2
+        gray = s == 0.0
+        return _pack_rgb_numpy(
+            numpy.where(gray, lum, _hue_channel_numpy(m1, m2, h + ONE_THIRD)),
+            numpy.where(gray, lum, _hue_channel_numpy(m1, m2, h)),
+            numpy.where(gray, lum, _hue_channel_numpy(m1, m2, h - ONE_THIRD))
+        )
+    return array('I', [pack_rgb(*hls_to_rgb(*hls)) for hls in zip(h, lum, s)])
+
+
+def from_hsv(h, s, v):
+    """Convert columns of hue (0-1), saturation and value to packed `0xRRGGBB` colors, like `RGBA.fromhsv`."""
+
+    if numpy is not None:
+        return _pack_rgb_numpy(*_hsv_to_rgb_numpy(*_columns(h, s, v)))
+    return array('I', [pack_rgb(*hsv_to_rgb(*hsv)) for hsv in zip(h, s, v)])
+
+
+def _hwb_to_hsv(h, w, b):
+    """Get the HSV of an HWB color, like `RGBA.fromhwb` converts it."""
+
+    if w + b > 1.0:
+        norm_factor = 1.0 / (w + b)
+        w *= norm_factor
+        b *= norm_factor
+    v = 1.0 - b
+    # `RGBA.fromhwb` divides by zero for pure black, which has no saturation
+    return h, 1.0 - (w / v) if v else 0.0, v
+
+
+def from_hwb(h, w, b):
+    """
+    Convert columns of hue (0-1), whiteness and blackness to packed `0xRRGGBB` colors, like `RGBA.fromhwb`.
+
+    Pure black, where `RGBA.fromhwb` raises `ZeroDivisionError`, converts to black.
+    """
+
+    if numpy is not None:
+        np = numpy
+        h, w, b = _columns(h, w, b)
+        total = w + b
+        over = total > 1.0
+        norm_factor = 1.0 / np.where(over, total, 1.0)
+        w = np.where(over, w * norm_factor, w)
+        b = np.where(over, b * norm_factor, b)
+        v = 1.0 - b
+        black = v == 0.0
+        s = np.where(black, 0.0, 1.0 - (w / np.where(black, 1.0, v)))
+        return _pack_rgb_numpy(*_hsv_to_rgb_numpy(h, s, v))
+    return array('I', [pack_rgb(*hsv_to_rgb(*_hwb_to_hsv(*hwb))) for hwb in zip(h, w, b)])
@@ -0,0 +1,375 @@
+"""
+Color index.
+
+Keeps the spans of all colors in a buffer in sorted arrays, so finding
+the color under a cursor is a binary search instead of a regex scan.
+
+Edits are applied incrementally: spans after an edit are shifted lazily
+through a "gap" (every span at or after the gap index still lacks the gap
+delta), so typing in one spot costs the same no matter how many spans
+follow, and only the lines touched by an edit are scanned again. To keep
+that line locality, colors are matched one line at a time, except for
+lines a functional color is left open over (`util.split_lines`). A large
+buffer is indexed a chunk at a time (`start_build` and `build_chunk`), so a full
+scan never holds up the thread it runs on for long.
+"""
+import threading
+from array import array
+from collections import deque
+from . import util
+
+# Stored in place of a color: a match without a known color, or one in a catalog that is still loading
+NO_COLOR = 1 << 32
+PENDING_COLOR = -1
+# Added to what is stored for a Pantone match, its color changes with the books selected
+PANTONE = 1 << 33
+# The most edit batches queued between refreshes, past it they are dropped for a full rebuild
+PENDING_LIMIT = 1000
+
+indexes = {}
+
+
+def get(buffer_id):
+    """Get the color index of a buffer, creating it when needed."""
+
+    index = indexes.get(buffer_id)
+    if index is None:
+        index = indexes[buffer_id] = ColorIndex()
+    return index
+
+
+def discard(buffer_id):
+    """Forget the color index of a buffer."""
+
+    indexes.pop(buffer_id, None)
+
+
+def touched(edits):
+    """
+    Get the merged ranges touched by a sequence of edits.
+
+    Each edit is a `(begin, end, length)` tuple: the region it replaced in the text
+    as it was before that edit, and the length of the new text. The ranges returned
+    are in coordinates of the text after all edits.
+
+    Edits from several cursors or a replace all come after or before all earlier ones.
+    Those are appended, or prepended with a running offset for the ranges they shift,
+    so only an edit amid earlier ranges has to map them all.
+    """
+
+    # sorted, non overlapping ranges, stored less the offset of the edits before them all
+    ranges = deque()
+    shift = 0
+    for begin, end, length in edits:
+        if not ranges or begin >= ranges[-1][1] + shift:
+            ranges.append((begin - shift, begin + length - shift))
+        elif end <= ranges[0][0] + shift:
+            shift += length - (end - begin)
+            ranges.appendleft((begin - shift, begin + length - shift))
+        else:
+            mapped = _map_ranges([(s + shift, e + shift) for s, e in ranges], begin, end, length)
+            mapped.append((begin, begin + length))
+            ranges = deque(_merge(mapped))
+            shift = 0
+    return _merge([(s + shift, e + shift) for s, e in ranges])
+
+
+def _map_ranges(ranges, begin, end, length):
+    """Map ranges through an edit."""
+
+    delta = length - (end - begin)
+    mapped = []
+    for s, e in ranges:
+        if s >= end:
+            s += delta
+        elif s > begin:
+            s = begin
+        if e >= end:
+            e += delta
+        elif e > begin:
+            e = begin + length
+        mapped.append((s, e))
+    return mapped
+
+
+def _merge(ranges):
+    """Merge overlapping or adjacent ranges."""
+
+    merged = []
+    for s, e in sorted(ranges):
+        if merged and s <= merged[-1][1]:
+            if e > merged[-1][1]:
+                merged[-1] = (merged[-1][0], e)
+        else:
+            merged.append((s, e))
+    return merged
+
+
+def scan(text, options, offset=0):
+    """
+    Scan text line by line for colors, returning their starts, ends and packed colors.
+
+    `options` is a tuple of the `use_hex_argb` flag and the set of enabled format families.
+    A match without a known color is stored as `NO_COLOR` and one whose catalog is still
+    loading as `PENDING_COLOR`, `ColorIndex.resolve` translates it once the catalog has loaded.
+    """
+
+    argb, formats = options
+    starts = array('l')
+    ends = array('l')
+    colors = array('q')
+    for line in util.split_lines(text, formats):
+        for m in util.find_colors(line, formats):
+            try:
+                color = util.translate_color(m, argb)
+            except Exception:
+                # one malformed literal must not keep the whole buffer from being indexed
+                color = None
+            if color is util.UNRESOLVED:
+                color = PENDING_COLOR
+            else:
+                if color is None:
+                    color = NO_COLOR
+                if m.lastgroup == 'pantone_code':
+                    color |= PANTONE
+            starts.append(m.start(0) + offset)
+            ends.append(m.end(0) + offset)
+            colors.append(color)
+        offset += len(line) + 1
+    return starts, ends, colors
+
+
+class ColorIndex(object):
+    """Sorted color spans of a buffer with their packed colors."""
+
+    def __init__(self):
+        """Initialize."""
+
+        self.change_count = -1
+        self.options = None
+        self.starts = array('l')
+        self.ends = array('l')
+        self.colors = array('q')
+        self.gap = 0
+        self.gap_delta = 0
+        self.pending = []
+        self.lock = threading.Lock()
+        # a rebuild scanning the text a chunk at a time: its change count and options,
+        # the offset it reached and the spans it found so far
+        self.build = None
+
+    def is_current(self, change_count, options):
+        """Check if the index reflects the given buffer state and options."""
+
+        return self.change_count == change_count and self.options == options
+
+    def invalidate(self):
+        """Force a full rebuild on the next refresh."""
+
+        self.change_count = -1
+
+    def rebuild(self, text, change_count, options):
+        """Scan the whole text and replace the index."""
+
+        self.starts, self.ends, self.colors = scan(text, options)
+        self.build = None
+        self.gap = 0
+        self.gap_delta = 0
+        self.change_count = change_count
+        self.options = options
+
+    def building(self, change_count, options):
+        """Check if a chunked rebuild of the given buffer state and options is under way."""
+
+        return self.build is not None and self.build[0] == change_count and self.build[1] == options
+
+    def start_build(self, change_count, options):
+        """Start a rebuild that scans the text a chunk at a time, through `build_chunk`."""
+
+        self.invalidate()
+        self.build = (change_count, options, 0, array('l'), array('l'), array('q'))
+
+    def build_chunk(self, text, done):
+        """
+        Scan the next chunk of a chunked rebuild, the text from the offset it reached.
+
+        A chunk has to end where no color can cross. When `done` is set, the chunk is the
+        last and the index takes the spans found.
+        """
+
+        change_count, options, offset, starts, ends, colors = self.build
+        found = scan(text, options, offset)
+        starts.extend(found[0])
+        ends.extend(found[1])
+        colors.extend(found[2])
+        if done:
+            self.build = None
+            self.starts, self.ends, self.colors = starts, ends, colors
+            self.gap = 0
+            self.gap_delta = 0
+            self.change_count = change_count
+            self.options = options
+        else:
+            self.build = (change_count, options, offset + len(text), starts, ends, colors)
+
+    def record(self, edits, change_count):
+        """
+        Queue edits to apply on the next refresh.
+
+        This is called from the UI thread, so it only stores the edits and the
+        change count they bring the buffer to. When refreshes stop, as with
+        live hints off, the queue is dropped past `PENDING_LIMIT` batches and
+        the index is rebuilt on the next refresh instead.
+        """
+
+        with self.lock:
+            if len(self.pending) >= PENDING_LIMIT:
+                self.pending = []
+                self.invalidate()
+            self.pending.append((change_count, edits))
+
+    def catch_up(self, change_count, options, read, expand):
+        """
+        Apply the queued edits and rescan the lines they touched.
+
+        `read(begin, end)` returns the text of a range and `expand(begin, end)`
+        widens a range to full lines. Returns `False` when the queued edits do
+        not bring the index up to `change_count`, a full rebuild is needed then.
+        """
+
+        with self.lock:
+            batches, self.pending = self.pending, []
+        if self.change_count < 0 or self.options != options:
+            return False
+        batches = [b for b in batches if b[0] > self.change_count]
+        if not batches or batches[-1][0] != change_count:
+            return False
+
+        edits = []
+        for _, batch in batches:
+            edits.extend(batch)
+        for begin, end, length in edits:
+            self._edit(begin, end, length)
+        for begin, end in touched(edits):
+            self._rescan(begin, end, options, read, expand)
+        self.change_count = change_count
+        return True
+
+    def resolve(self, read):
+        """
+        Translate the colors that were pending while their catalog loaded, without a rescan.
+
+        `read(begin, end)` returns the text of a range, the index has to be current.
+        """
+
+        colors = self.colors
+        # the same codes tend to repeat through a buffer
+        translated = {}
+        for i, color in enumerate(colors):
+            if color == PENDING_COLOR:
+                text = read(self._value(self.starts, i), self._value(self.ends, i))
+                color = translated.get(text)
+                if color is None:
+                    _, ends, found = scan(text, self.options)
+                    color = translated[text] = found[0] if len(found) == 1 and ends[0] == len(text) else NO_COLOR
+                colors[i] = color
+
+    def has_pending(self):
+        """Check if any color is pending."""
+
+        return PENDING_COLOR in self.colors
+
+    def unresolve_pantone(self):
+        """Mark the Pantone colors pending, for the books selected have changed."""
+
+        colors = self.colors
+        for i, color in enumerate(colors):
+            if color >= 0 and color & PANTONE:
+                colors[i] = PENDING_COLOR
+
+    def lookup(self, point):
+        """Get the packed color at the point, `None` if there is none."""
+
+        i = self._bisect(self.starts, point + 1) - 1
+        if i >= 0 and point < self._value(self.ends, i):
+            color = self.colors[i]
+            if color >= 0 and not color & NO_COLOR:
+                return color & 0xFFFFFFFF
+        return None
+
+    def _value(self, arr, i):
+        """Get the real offset stored at the index."""
+
+        return arr[i] + self.gap_delta if i >= self.gap else arr[i]
+
+    def _bisect(self, arr, point):
+        """Get the index of the first offset not lower than the point."""
+
+        lo = 0
+        hi = len(arr)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._value(arr, mid) < point:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _move_gap(self, i, delta):
+        """Add a delta to every span from index `i` on, touching only the spans between `i` and the gap."""
+
+        starts, ends = self.starts, self.ends
+        if i > self.gap:
+            for j in range(self.gap, i):
+                starts[j] += self.gap_delta
+                ends[j] += self.gap_delta
+        elif i < self.gap:
+            for j in range(i, self.gap):
+                starts[j] -= self.gap_delta
+                ends[j] -= self.gap_delta
+        self.gap = i
+        self.gap_delta += delta
+
+    def _delete(self, i, j):
+        """Delete the spans from index `i` up to `j`."""
+
+        if i >= j:
+            return
+        del self.starts[i:j]
+        del self.ends[i:j]
+        del self.colors[i:j]
+        if self.gap >= j:
+            self.gap -= j - i
+        elif self.gap > i:
+            self.gap = i
+
+    def _insert(self, i, starts, ends, colors):
+        """Insert spans with real offsets at index `i`."""
+
+        if i <= self.gap:
+            self.gap += len(starts)
+        elif self.gap_delta:
+            starts = array('l', [s - self.gap_delta for s in starts])
+            ends = array('l', [e - self.gap_delta for e in ends])
+        self.starts[i:i] = starts
+        self.ends[i:i] = ends
+        self.colors[i:i] = colors
+
+    def _edit(self, begin, end, length):
+        """Drop the spans an edit overlaps and shift the ones after it."""
+
+        i = self._bisect(self.ends, begin)
+        j = self._bisect(self.starts, end)
+        self._delete(i, j)
+        delta = length - (end - begin)
+        if delta:
+            self._move_gap(i, delta)
+
+    def _rescan(self, begin, end, options, read, expand):
+        """Replace the spans on the lines of a range with a fresh scan."""
+
+        begin, end = expand(begin, end)
+        i = self._bisect(self.ends, begin + 1)
+        j = self._bisect(self.starts, end)
+        self._delete(i, j)
+        self._insert(i, *scan(read(begin, end), options, begin))
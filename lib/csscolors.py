@@ -5,6 +5,8 @@ A simple name to hex and hex to name map of CSS3 colors.
 
 http://www.w3.org/TR/SVG/types.html#ColorKeywords
 """
+from .catalog import ColorCatalog
+
 name2hex_map = {
     'aliceblue': '#f0f8ff',
     'antiquewhite': '#faebd7',
@@ -156,16 +158,17 @@ name2hex_map = {
     'yellowgreen': '#9acd32'
 }
 
-hex2name_map = dict([(v, k) for k, v in name2hex_map.items()])
+catalog = ColorCatalog('names', lambda: ((name, int(value[1:], 16)) for name, value in name2hex_map.items()))
 
 
 def hex2name(value):
     """Convert CSS hex to webcolor name."""
 
-    return hex2name_map.get(value.lower(), None)
+    names = catalog.keys_of(int(value[1:], 16))
+    return names[-1] if names else None
 
 
 def name2hex(name):
     """Convert webcolor name to CSS hex."""
 
-    return name2hex_map.get(name.lower(), None)
+    return catalog.hex(name)
@@ -0,0 +1,219 @@
+"""
+Fused color filters.
+
+A `FilterChain` declares a run of the `RGBA` filters once and compiles it
+into stages: consecutive filters that work on HLS share one conversion to
+HLS and back, consecutive filters that work on RGB run on the channels
+directly. Channels stay floats through the chain and are rounded once at
+the end, where `RGBA` converts and rounds at every filter. A single filter
+lands within a unit per channel of its `RGBA` call, but a chain is not
+rounded between filters: brightness clips at thresholds and saturation and
+hue turn on the hue of nearly gray colors, so a chain holding them can land
+far from the same `RGBA` calls.
+"""
+from array import array
+from colorsys import hls_to_rgb, rgb_to_hls
+from .rgba import HUE_SCALE, RGB_CHANNEL_SCALE, clamp, pack, round_int, unpack
+
+
+def adjust(c, factor):
+    """Adjust a channel by a factor, like `RGBA.red` and friends."""
+
+    return clamp(c + (255.0 * factor) - 255.0, 0.0, 255.0)
+
+
+def red(r, g, b, factor):
+    """Adjust red."""
+
+    return adjust(r, factor), g, b
+
+
+def green(r, g, b, factor):
+    """Adjust green."""
+
+    return r, adjust(g, factor), b
+
+
+def blue(r, g, b, factor):
+    """Adjust blue."""
+
+    return r, g, adjust(b, factor)
+
+
+def contrast(r, g, b, factor):
+    """Adjust contrast."""
+
+    f = (clamp(factor, 0.0, 2.0) - 1.0) * 255.0
+    f = (259 * (f + 255)) / (255 * (259 - f))
+    return (
+        clamp((f * (r - 128)) + 128, 0.0, 255.0),
+        clamp((f * (g - 128)) + 128, 0.0, 255.0),
+        clamp((f * (b - 128)) + 128, 0.0, 255.0)
+    )
+
+
+def invert(r, g, b):
+    """Invert the color."""
+
+    return 255.0 - r, 255.0 - g, 255.0 - b
+
+
+def grayscale(r, g, b):
+    """Convert the color with a grayscale filter."""
+
+    luminance = clamp(0.299 * r + 0.587 * g + 0.114 * b, 0.0, 255.0)
+    return luminance, luminance, luminance
+
+
+def sepia(r, g, b):
+    """Apply a sepia filter to the color."""
+
+    return (
+        clamp((r * .393) + (g * .769) + (b * .189), 0.0, 255.0),
+        clamp((r * .349) + (g * .686) + (b * .168), 0.0, 255.0),
+        clamp((r * .272) + (g * .534) + (b * .131), 0.0, 255.0)
+    )
+
+
+def brightness(r, g, b, factor):
+    """Adjust the brightness by the given factor, spreading what a channel overflows over the others."""
+
+    luminance = 0.299 * r + 0.587 * g + 0.114 * b
+    # the target starts from the rounded luminance, like `RGBA.get_luminance`, so does the clipping to white or black
+    total_lumes = clamp(clamp(round_int(luminance), 0, 255) + (255.0 * factor) - 255.0, 0.0, 255.0)
+    if total_lumes == 255.0:
+        return 255.0, 255.0, 255.0
+    if total_lumes == 0.0:
+        return 0.0, 0.0, 0.0
+    pts = total_lumes - luminance
+    components = [r + pts, g + pts, b + pts]
+    slots = [0, 1, 2]
+    for i in range(3):
+        c = components[i]
+        overage = c if c < 0.0 else (c - 255.0 if c > 255.0 else 0.0)
+        if overage:
+            components[i] = clamp(c, 0.0, 255.0)
+            slots.remove(i)
+            if slots:
+                parts = overage / len(slots)
+                for j in slots:
+                    components[j] += parts
+    return components[0], components[1], components[2]
+
+
+def luminance(h, lum, s, factor):
+    """Adjust the lightness."""
+
+    return h, clamp(lum + factor - 1.0, 0.0, 1.0), s
+
+
+def saturation(h, lum, s, factor):
+    """Saturate or unsaturate the color by the given factor."""
+
+    return h, lum, clamp(s + factor - 1.0, 0.0, 1.0)
+
+
+def hue(h, lum, s, deg):
+    """Shift the hue."""
+
+    h = h + deg * HUE_SCALE
+    while h > 1.0:
+        h -= 1.0
+    while h < 0.0:
+        h += 1.0
+    return h, lum, s
+
+
+def colorize(h, lum, s, deg):
+    """Colorize the color with the given hue."""
+
+    return clamp(deg * HUE_SCALE, 0.0, 1.0), lum, s
+
+
+# Filters a lookup table can't interpolate: brightness jumps where it clips, saturation at grays
+ROUGH_FILTERS = frozenset(['brightness', 'saturation'])
+
+# Filters by name, with the color space they work in
+FILTERS = {
+    'red': ('rgb', red),
+    'green': ('rgb', green),
+    'blue': ('rgb', blue),
+    'contrast': ('rgb', contrast),
+    'invert': ('rgb', invert),
+    'grayscale': ('rgb', grayscale),
+    'sepia': ('rgb', sepia),
+    'brightness': ('rgb', brightness),
+    'luminance': ('hls', luminance),
+    'saturation': ('hls', saturation),
+    'hue': ('hls', hue),
+    'colorize': ('hls', colorize),
+}
+
+
+class FilterChain(object):
+    """A chain of filters, compiled into as few color space conversions as possible."""
+
+    def __init__(self, steps):
+        """
+        Compile the steps, each a filter name or a tuple of a filter name and its arguments.
+
+        `alpha` adjusts the alpha channel, apart from the color, the other filters are the ones of `FILTERS`.
+        """
+
+        self.stages = []
+        self.alpha = []
+        # the steps as a hashable tuple, equal chains have equal signatures
+        self.signature = tuple((step,) if isinstance(step, str) else tuple(step) for step in steps)
+        # whether a lookup table can interpolate the chain
+        self.smooth = not any(step[0] in ROUGH_FILTERS for step in self.signature)
+        for name, *args in self.signature:
+            if name == 'alpha':
+                self.alpha.append(args[0])
+                continue
+            if name not in FILTERS:
+                raise ValueError('Unknown filter %r' % name)
+            space, fn = FILTERS[name]
+            if not self.stages or self.stages[-1][0] != space:
+                self.stages.append((space, []))
+            self.stages[-1][1].append((fn, args))
+
+    def conversions(self):
+        """Get the number of round trips to HLS the chain takes."""
+
+        return sum(1 for space, _ in self.stages if space == 'hls')
+
+    def apply(self, color):
+        """Filter a packed `0xRRGGBBAA` color."""
+
+        r, g, b, a = unpack(color)
+        for space, filters in self.stages:
+            if space == 'hls':
+                h, lum, s = rgb_to_hls(r * RGB_CHANNEL_SCALE, g * RGB_CHANNEL_SCALE, b * RGB_CHANNEL_SCALE)
+                for fn, args in filters:
+                    h, lum, s = fn(h, lum, s, *args)
+                r, g, b = hls_to_rgb(h, lum, s)
+                r, g, b = r * 255.0, g * 255.0, b * 255.0
+            else:
+                for fn, args in filters:
+                    r, g, b = fn(r, g, b, *args)
+        for factor in self.alpha:
+            a = adjust(a, factor)
+        return pack(
+            clamp(round_int(r), 0, 255), clamp(round_int(g), 0, 255), clamp(round_int(b), 0, 255),
+            clamp(round_int(a), 0, 255)
+        )
+
+    __call__ = apply
+
+    def apply_all(self, colors):
+        """Filter packed `0xRRGGBBAA` colors, running the chain once for every distinct color."""
+
+        filtered = {}
+        result = array('I')
+        for color in colors:
+            color = int(color)
+            out = filtered.get(color)
+            if out is None:
+                out = filtered[color] = self.apply(color)
+            result.append(out)
+        return result
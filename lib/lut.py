@@ -0,0 +1,176 @@
+"""
+Color lookup tables.
+
+A transform of RGB, like a `FilterChain`, is baked once into a 3D table
+sampled on a grid of every channel, and colors are looked up with
+trilinear interpolation between the 8 samples around them. The exact mode
+runs the transform itself, once per distinct color, for pipelines that
+have to stay bit exact. Tables are cached by the signature of their
+transform. An interpolated table looks alpha up in a table of its own,
+assuming, like the filters, that alpha and RGB do not affect each other.
+
+Interpolation assumes the transform is smooth between samples, which
+holds within 2 units per channel for filters like sepia, contrast or hue.
+Raising saturation is not smooth, it jumps at grays as they have no hue,
+nor is brightness, which jumps where it clips to white or black. Tables of
+those miss by 30 units and brightness by over 100 near the jumps, so a
+transform with a false `smooth` attribute, like a chain holding them,
+always gets the exact mode.
+"""
+from array import array
+from .rgba import round_int
+from .util import LRUCache
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Samples per channel of a table
+LUT_SIZE = 33
+# Tables kept, by transform signature
+luts = LRUCache(16)
+# Colors an exact table remembers, it starts over when full
+EXACT_SIZE = 1 << 16
+
+
+class ColorLUT(object):
+    """A transform of packed `0xRRGGBBAA` colors baked into a 3D table with trilinear lookups."""
+
+    def __init__(self, transform, size=LUT_SIZE):
+        """Bake the transform, sampling each channel at `size` points from 0 to 255."""
+
+        self.size = size
+        grid = [round_int(i * 255.0 / (size - 1)) for i in range(size)]
+        # the cell below each channel value and how far into it the value lies
+        self.index = array('H')
+        self.weight = array('d')
+        cell = 0
+        for v in range(256):
+            while cell < size - 2 and grid[cell + 1] <= v:
+                cell += 1
+            self.index.append(cell)
+            self.weight.append((v - grid[cell]) / (grid[cell + 1] - grid[cell]))
+        # offsets of the cell of each channel value in the tables
+        self.red_offset = [i * size * size for i in self.index]
+        self.green_offset = [i * size for i in self.index]
+        self.red = array('B')
+        self.green = array('B')
+        self.blue = array('B')
+        self.alpha = array('B', [transform(a) & 0xFF for a in range(256)])
+        for r in grid:
+            for g in grid:
+                for b in grid:
+                    color = transform(r << 24 | g << 16 | b << 8 | 0xFF)
+                    self.red.append(color >> 24 & 0xFF)
+                    self.green.append(color >> 16 & 0xFF)
+                    self.blue.append(color >> 8 & 0xFF)
+
+    def apply(self, color):
+        """Look a packed `0xRRGGBBAA` color up."""
+
+        weight, size = self.weight, self.size
+        r, g, b = color >> 24 & 0xFF, color >> 16 & 0xFF, color >> 8 & 0xFF
+        rw, gw, bw = weight[r], weight[g], weight[b]
+        # offsets of the 8 corners of the cell
+        c000 = self.red_offset[r] + self.green_offset[g] + self.index[b]
+        c010 = c000 + size
+        c100 = c000 + size * size
+        c110 = c100 + size
+        packed = self.alpha[color & 0xFF]
+        for shift, t in ((24, self.red), (16, self.green), (8, self.blue)):
+            c00 = t[c000] + (t[c000 + 1] - t[c000]) * bw
+            c01 = t[c010] + (t[c010 + 1] - t[c010]) * bw
+            c10 = t[c100] + (t[c100 + 1] - t[c100]) * bw
+            c11 = t[c110] + (t[c110 + 1] - t[c110]) * bw
+            c0 = c00 + (c01 - c00) * gw
+            c = c0 + (c10 + (c11 - c10) * gw - c0) * rw
+            # the samples are 0 to 255, so is anything between them: round halves up like `round_int`
+            i = int(c)
+            packed |= (i + 1 if c - i >= 0.5 else i) << shift
+        return packed
+
+    __call__ = apply
+
+    def apply_all(self, colors):
+        """Look packed `0xRRGGBBAA` colors up, vectorized with NumPy when it is available."""
+
+        if numpy is None:
+            return array('I', [self.apply(int(color)) for color in colors])
+        np = numpy
+        colors = np.asarray(colors, dtype=np.uint32)
+        index = np.frombuffer(self.index, dtype=np.uint16).astype(np.intp)
+        weight = np.frombuffer(self.weight, dtype=np.float64)
+        size = self.size
+        channels = [colors >> shift & 0xFF for shift in (24, 16, 8)]
+        ri, gi, bi = [index[c] for c in channels]
+        rw, gw, bw = [weight[c] for c in channels]
+        c000 = (ri * size + gi) * size + bi
+        packed = np.frombuffer(self.alpha, dtype=np.uint8).astype(np.uint32)[colors & 0xFF]
+        for shift, table in ((24, self.red), (16, self.green), (8, self.blue)):
+            table = np.frombuffer(table, dtype=np.uint8).astype(np.float64)
+
+            def corner(dr, dg, db):
+                """Get the samples at a corner of the cells."""
+
+                return table[c000 + (dr * size + dg) * size + db]
+
+            c00 = corner(0, 0, 0) + (corner(0, 0, 1) - corner(0, 0, 0)) * bw
+            c01 = corner(0, 1, 0) + (corner(0, 1, 1) - corner(0, 1, 0)) * bw
+            c10 = corner(1, 0, 0) + (corner(1, 0, 1) - corner(1, 0, 0)) * bw
+            c11 = corner(1, 1, 0) + (corner(1, 1, 1) - corner(1, 1, 0)) * bw
+            c0 = c00 + (c01 - c00) * gw
+            c1 = c10 + (c11 - c10) * gw
+            c = c0 + (c1 - c0) * rw
+            # round halves away from zero like `round_int`, the values are never negative
+            whole = np.floor(c)
+            packed |= np.clip(whole + (c - whole >= 0.5), 0, 255).astype(np.uint32) << shift
+        return packed
+
+
+class ExactLUT(object):
+    """A transform of packed `0xRRGGBBAA` colors, run once for each distinct color and remembered."""
+
+    def __init__(self, transform, size=EXACT_SIZE):
+        """Wrap the transform, remembering up to `size` colors."""
+
+        self.transform = transform
+        self.size = size
+        # a plain dict, a lookup has to cost less than most transforms
+        self.colors = {}
+
+    def apply(self, color):
+        """Look a packed `0xRRGGBBAA` color up."""
+
+        found = self.colors.get(color)
+        if found is None:
+            found = self.transform(color)
+            if len(self.colors) >= self.size:
+                self.colors.clear()
+            self.colors[color] = found
+        return found
+
+    __call__ = apply
+
+    def apply_all(self, colors):
+        """Look packed `0xRRGGBBAA` colors up."""
+
+        return array('I', [self.apply(int(color)) for color in colors])
+
+
+def lut(transform, size=LUT_SIZE, exact=False):
+    """
+    Get the lookup table of a transform of packed `0xRRGGBBAA` colors, baking it on first use.
+
+    Tables are cached by the `signature` of the transform, or the transform itself when it has none.
+    Interpolated tables only suit smooth transforms, one with a false `smooth` attribute, like a chain
+    that adjusts saturation or brightness, always gets an exact table.
+    """
+
+    exact = exact or not getattr(transform, 'smooth', True)
+    key = (getattr(transform, 'signature', transform), None if exact else size)
+    table = luts.get(key)
+    if table is None:
+        table = ExactLUT(transform) if exact else ColorLUT(transform, size)
+        luts.put(key, table)
+    return table
@@ -0,0 +1,106 @@
+"""
+Nearest catalog colors.
+
+The colors of a catalog (CSS names, RAL or Pantone) are kept in a k-d
+tree over CIELAB. A query descends to the leaf of a color and only visits
+the other side of a split when it could hold a closer color, so it
+touches a few dozen colors, not every color. Distances are CIE76 delta E,
+the euclidean distance in CIELAB.
+"""
+import heapq
+from array import array
+from . import colorarray, util
+
+# Ranges of colors a k-d tree no longer splits
+LEAF_SIZE = 8
+
+trees = {}
+
+
+class ColorTree(object):
+    """A k-d tree over CIELAB of labeled colors."""
+
+    def __init__(self, colors):
+        """Build the tree of `(label, 0xRRGGBB)` pairs."""
+
+        colors = list(colors)
+        labs = colorarray.to_array(colorarray.to_lab([color for _, color in colors]))
+        entries = [(label, color, tuple(labs[i * 3:i * 3 + 3])) for i, (label, color) in enumerate(colors)]
+        self._build(entries, 0, len(entries), 0)
+        self.labels = [label for label, _, _ in entries]
+        self.colors = array('I', [color for _, color, _ in entries])
+        self.points = array('d')
+        for _, _, lab in entries:
+            self.points.extend(lab)
+
+    def __len__(self):
+        """Get the number of colors."""
+
+        return len(self.labels)
+
+    def _build(self, entries, lo, hi, depth):
+        """Order the entries in place as an implicit tree: the median of a range splits it on the axis of its depth."""
+
+        while hi - lo > LEAF_SIZE:
+            axis = depth % 3
+            entries[lo:hi] = sorted(entries[lo:hi], key=lambda e: e[2][axis])
+            mid = (lo + hi) // 2
+            self._build(entries, lo, mid, depth + 1)
+            lo = mid + 1
+            depth += 1
+
+    def nearest(self, color, k=1):
+        """Get the `k` colors nearest to a packed `0xRRGGBB` color, as sorted `(delta E, label, color)` tuples."""
+
+        if not self.labels or k < 1:
+            return []
+        ql, qa, qb = lab = colorarray.rgb_to_lab(color)
+        points = self.points
+        # a max heap of the best `k` as `(-squared distance, index)`
+        best = []
+        # ranges to visit with the squared distance to their side of the split
+        stack = [(0, len(self.labels), 0, 0.0)]
+        while stack:
+            lo, hi, depth, bound = stack.pop()
+            if len(best) == k and bound >= -best[0][0]:
+                continue
+            if hi - lo > LEAF_SIZE:
+                mid = (lo + hi) // 2
+                axis = depth % 3
+                diff = lab[axis] - points[mid * 3 + axis]
+                if diff < 0:
+                    stack.append((mid + 1, hi, depth + 1, diff * diff))
+                    stack.append((lo, mid, depth + 1, bound))
+                else:
+                    stack.append((lo, mid, depth + 1, diff * diff))
+                    stack.append((mid + 1, hi, depth + 1, bound))
+                lo, hi = mid, mid + 1
+            for i in range(lo, hi):
+                dl = points[i * 3] - ql
+                da = points[i * 3 + 1] - qa
+                db = points[i * 3 + 2] - qb
+                distance = dl * dl + da * da + db * db
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, i))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, i))
+        return [((-d) ** 0.5, self.labels[i], self.colors[i]) for d, i in sorted(best, reverse=True)]
+
+
+def tree(catalog):
+    """Get the k-d tree of a catalog, `None` while it is loading."""
+
+    colors = util.catalog(catalog)
+    if not colors.available():
+        return None
+    cached = trees.get(catalog)
+    if cached is None or cached[0] != colors.version():
+        cached = trees[catalog] = (colors.version(), ColorTree(colors.labeled()))
+    return cached[1]
+
+
+def nearest(color, catalog, k=1):
+    """Get the `k` colors of a catalog nearest to a packed `0xRRGGBB` color, an empty list while it is loading."""
+
+    colors = tree(catalog)
+    return [] if colors is None else colors.nearest(color, k)
@@ -1,13 +1,34 @@
 """
 Return the RGB value of a Pantone color code
 
+The books load on a background thread the first time a code is looked up,
+until then lookups return `PENDING`. Books that have to be compiled at load
+time, because they are not in the shipped catalog or only some of its books
+are chosen, are cached under the cache path, keyed by a hash of their source.
 """
-import json
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
 import sublime
-from .rgba import round_int, clamp
+from .catalog import PENDING, CatalogStats, ColorCatalog, normalize
+from .pantonebook import CATALOG, Catalog, compile_books, parse_book
 
-pantone_name_map = {}
-pantone_code_map = {}
+# Where a loaded book was read from, its number of codes and names, the seconds reading took and the bytes it keeps
+BookStats = namedtuple('BookStats', ['book', 'source', 'entries', 'seconds', 'memory'])
+
+# Loaded catalogs with the rank of each of their books, later books win
+catalogs = []
+stats = []
+# Counts the loads, to tell when data derived from the catalogs is outdated
+generation = 0
+# Seconds the last load took
+load_seconds = 0.0
+ready = threading.Event()
+loader = None
+loader_lock = threading.Lock()
+ready_callbacks = []
 pantone_books = [
     'pantoneCmykCoated.json',
     'pantoneCmykUncoated.json',
@@ -26,36 +47,291 @@ pantone_books = [
     'pantoneSolidCoatedV3M2.json',
     'pantoneSolidUncoatedV3M2.json',
 ]
+# The books to load, from the `pantone_books` setting
+selected_books = list(pantone_books)
+# Threads reading and decoding JSON books that are not in the compiled catalog
+LOADER_THREADS = 4
+
+
+def cached(name, source, compile_catalog):
+    """
+    Get a compiled catalog from the cache, compiling and caching it when needed.
+
+    The cache file holds the SHA-1 of the source bytes and the SHA-1 of the catalog
+    ahead of the catalog. A file for another source, one whose catalog does not match
+    its hash, or one that cannot be read, is compiled again. Returns the catalog and
+    whether it came from the cache.
+    """
+
+    path = os.path.join(sublime.cache_path(), 'ColorHints', name)
+    digest = hashlib.sha1(source).digest()
+    size = len(digest)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        payload = data[2 * size:]
+        if data[:size] == digest and data[size:2 * size] == hashlib.sha1(payload).digest():
+            return Catalog(payload), True
+    except Exception:
+        pass
+    data = compile_catalog()
+    catalog = Catalog(data)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(digest + hashlib.sha1(data).digest() + data)
+        os.replace(path + '.tmp', path)
+    except OSError:
+        pass
+    return catalog, False
+
+
+def load_catalog(books):
+    """
+    Load the compiled catalog cut down to the given books, `None` if it is missing or unreadable.
+
+    Returns the catalog and where it was read from.
+    """
+
+    locations = sublime.find_resources(CATALOG)
+    if locations:
+        data = sublime.load_binary_resource(locations[0])
+        try:
+            catalog = Catalog(data)
+        except Exception:
+            return None
+        # in the order of the catalog, the ranks decide which book wins, not the order they are packed in
+        books = [book for book in catalog.books if book in books]
+        if books == catalog.books:
+            return catalog, CATALOG
+        # only keep the chosen books in memory
+        catalog, hit = cached(
+            'selected-books.bin', data + '\n'.join(books).encode('utf-8'), lambda: catalog.pack_books(books)
+        )
+        return catalog, 'cache' if hit else CATALOG
+    return None
+
+
+def load_book(book):
+    """
+    Compile a JSON book into a catalog of its own, `None` if it is missing.
+
+    Returns the catalog, where it was read from and the seconds it took.
+    """
+
+    start = time.perf_counter()
+    locations = sublime.find_resources(book)
+    if locations:
+        data = sublime.load_binary_resource(locations[0])
+        catalog, hit = cached(
+            os.path.splitext(book)[0] + '.bin', data, lambda: compile_books([(book, parse_book(data))])
+        )
+        return catalog, 'cache' if hit else 'json', time.perf_counter() - start
+    return None
+
+
+def read_books(books):
+    """Read the books, returning catalogs with the rank of each of their books, and the stats of every book."""
+
+    loaded = []
+    book_stats = []
+    start = time.perf_counter()
+    catalog = load_catalog(books)
+    if catalog is not None:
+        catalog, source = catalog
+        seconds = time.perf_counter() - start
+        if catalog.books:
+            loaded.append((catalog, [books.index(book) + 1 for book in catalog.books]))
+        for i, book in enumerate(catalog.books):
+            entries, memory = catalog.book_sizes(i)
+            book_stats.append(BookStats(book, source, entries, seconds, memory))
+    # not compiled, fall back to parsing the JSON, reading one book while decoding another
+    missing = [book for book in books if catalog is None or book not in catalog.books]
+    if missing:
+        # imported here, as it is slow to import and rarely needed
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(min(len(missing), LOADER_THREADS)) as pool:
+            # `map` keeps the order of the books, the ranks decide which book wins
+            for book, result in zip(missing, pool.map(load_book, missing)):
+                if result is not None:
+                    compiled, source, seconds = result
+                    loaded.append((compiled, [books.index(book) + 1]))
+                    entries, memory = compiled.book_sizes(0)
+                    book_stats.append(BookStats(book, source, entries, seconds, memory))
+    book_stats.sort(key=lambda s: books.index(s.book))
+    return loaded, book_stats
 
 
-def load():
+def load(books=None):
     """Load Pantone books into memory."""
 
-    for book in pantone_books:
-        locations = sublime.find_resources(book)
-        if locations:
-            data = sublime.load_resource(locations[0])
-            colors = json.loads(data)['data']['getBook']['colors']
-            for color in colors:
-                code = color['code']
-                name = color['name']
-                hex_value = "#%02x%02x%02x" % (
-                    clamp(round_int(float(color['rgb']['r'])), 0, 255),
-                    clamp(round_int(float(color['rgb']['g'])), 0, 255),
-                    clamp(round_int(float(color['rgb']['b'])), 0, 255)
-                )
-                pantone_code_map[code.lower()] = hex_value
-                if name:
-                    pantone_name_map[name.lower()] = hex_value
+    global generation, load_seconds
+
+    start = time.perf_counter()
+    loaded, book_stats = read_books(selected_books if books is None else books)
+    catalogs[:] = loaded
+    stats[:] = book_stats
+    load_seconds = time.perf_counter() - start
+    generation += 1
+    ready.set()
+
+
+def select_books(books):
+    """Choose the books to load, in order of precedence. Returns whether the choice changed."""
+
+    with loader_lock:
+        if books == selected_books:
+            return False
+        selected_books[:] = books
+        if ready.is_set():
+            # load the new choice on next use
+            ready.clear()
+            catalogs[:] = []
+            stats[:] = []
+        return True
+
+
+def load_async():
+    """Start loading the books on a background thread, unless they are loaded or loading."""
+
+    global loader
+
+    with loader_lock:
+        if loader is None and not ready.is_set():
+            loader = threading.Thread(target=run_loader, daemon=True)
+            loader.start()
+
+
+def run_loader():
+    """Load the books and notify the callbacks waiting for them."""
+
+    global loader, generation, load_seconds
+
+    while True:
+        with loader_lock:
+            books = list(selected_books)
+        start = time.perf_counter()
+        try:
+            loaded, book_stats = read_books(books)
+        except Exception:
+            loaded, book_stats = [], []
+        with loader_lock:
+            # load again if the choice of books changed meanwhile
+            if books == selected_books:
+                catalogs[:] = loaded
+                stats[:] = book_stats
+                load_seconds = time.perf_counter() - start
+                generation += 1
+                ready.set()
+                loader = None
+                break
+    for callback in ready_callbacks:
+        callback()
+
+
+def add_ready_callback(callback):
+    """Call the callback, from the loader thread, when the books finish loading."""
+
+    ready_callbacks.append(callback)
+
+
+def remove_ready_callback(callback):
+    """Stop calling the callback when the books finish loading."""
+
+    if callback in ready_callbacks:
+        ready_callbacks.remove(callback)
+
+
+def lookup(key, table):
+    """Look a normalized key up in a table of every catalog, `PENDING` while the books are loading."""
+
+    if not ready.is_set():
+        load_async()
+        return PENDING
+    found = None
+    for catalog, ranks in catalogs:
+        entry = getattr(catalog, table).get(key, ranks)
+        if entry is not None and (found is None or entry[0] > found[0]):
+            found = entry
+    return None if found is None else found[1]
+
+
+def colors():
+    """Get the `(code, color)` pairs of the loaded books, with the winning color of codes in several books."""
+
+    found = {}
+    for catalog, ranks in catalogs:
+        for key, color, book in catalog.codes.entries():
+            rank = ranks[book]
+            if rank and (key not in found or rank > found[key][0]):
+                found[key] = (rank, color)
+    return [(key, color) for key, (_, color) in found.items()]
+
+
+class PantoneCatalog(ColorCatalog):
+    """The codes of the loaded books, lookups return `PENDING` while they load."""
+
+    def __init__(self):
+        """Define the catalog."""
+
+        super().__init__('pantone', None, lambda code: 'PANTONE ' + code.upper())
+
+    def load(self):
+        """Start loading the books, unless they are loaded or loading."""
+
+        load_async()
+
+    def available(self):
+        """Check the books are loaded, starting to load them when they aren't."""
+
+        if not ready.is_set():
+            load_async()
+            return False
+        return True
+
+    def version(self):
+        """Get the load generation."""
+
+        return generation
+
+    def __len__(self):
+        """Get the number of codes."""
+
+        return len(colors())
+
+    def get(self, key, default=None):
+        """Get the packed color of a code."""
+
+        color = lookup(normalize(key), 'codes')
+        return default if color is None else color
+
+    def items(self):
+        """Get the codes and their winning colors, none while the books load."""
+
+        return colors()
+
+    def memory(self):
+        """Get the bytes the loaded books take."""
+
+        return sum(s.memory for s in stats)
+
+    def stats(self):
+        """Get the size and load time of the loaded books."""
+
+        return CatalogStats(self.name, len(self), load_seconds, self.memory())
+
+
+catalog = PantoneCatalog()
 
 
 def code2hex(code):
     """Convert Pantone color code to CSS hex."""
 
-    return pantone_code_map.get(code.lower(), None)
+    return catalog.hex(code)
 
 
 def name2hex(name):
     """Convert Pantone color name to CSS hex."""
 
-    return pantone_name_map.get(name.lower(), None)
+    color = lookup(normalize(name), 'names')
+    return '#%06x' % color if isinstance(color, int) else color
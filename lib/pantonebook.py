@@ -0,0 +1,220 @@
+"""
+Compiled Pantone books.
+
+The JSON books are compiled into one small binary catalog holding two
+tables, codes and names. Each table is a sorted run of fixed width, NUL
+padded, normalized keys, followed by the packed `0xRRGGBB` color and the
+book number of every key. A key that is in several books has an entry per
+book, so the books to use and which of them wins can be picked at load time.
+Loading the catalog is a few slices, a lookup is a bisect.
+
+Compile the books after changing them, from the package root:
+
+    python -m lib.pantonebook
+"""
+import json
+import os
+import struct
+import sys
+from array import array
+from .catalog import normalize
+from .rgba import round_int, clamp
+
+MAGIC = b'CHPB'
+VERSION = 2
+HEADER = struct.Struct('<4sHH')
+TABLE = struct.Struct('<HI')
+
+BOOKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pantone-books')
+CATALOG = 'pantone.bin'
+
+
+def parse_book(data):
+    """Parse a JSON book into lists of `(code, color)` and `(name, color)` pairs."""
+
+    codes = []
+    names = []
+    for color in json.loads(data)['data']['getBook']['colors']:
+        rgb = color['rgb']
+        packed = (
+            clamp(round_int(float(rgb['r'])), 0, 255) << 16 |
+            clamp(round_int(float(rgb['g'])), 0, 255) << 8 |
+            clamp(round_int(float(rgb['b'])), 0, 255)
+        )
+        codes.append((normalize(color['code']), packed))
+        if color['name'] and color['name'].strip():
+            names.append((normalize(color['name']), packed))
+    return codes, names
+
+
+def pack_table(entries):
+    """Pack `(key, color, book)` entries into a table, the last entry of a key in a book wins."""
+
+    table = dict(((key.encode('utf-8'), book), color) for key, color, book in entries)
+    keys = sorted(table)
+    width = max((len(key) for key, _ in keys), default=0)
+    colors = array('I', [table[key] for key in keys])
+    if sys.byteorder == 'big':
+        colors.byteswap()
+    return b''.join([
+        TABLE.pack(width, len(keys)),
+        b''.join(key.ljust(width, b'\0') for key, _ in keys),
+        colors.tobytes(),
+        bytes(book for _, book in keys)
+    ])
+
+
+def pack_catalog(books, codes, names):
+    """Pack book names and `(key, color, book)` entries of codes and names into a catalog."""
+
+    books = [book.encode('utf-8') for book in books]
+    return b''.join([
+        HEADER.pack(MAGIC, VERSION, len(books)),
+        b''.join(struct.pack('<H', len(book)) + book for book in books),
+        pack_table(codes),
+        pack_table(names)
+    ])
+
+
+def compile_books(books):
+    """Compile `(name, parsed book)` pairs into a binary catalog."""
+
+    codes = []
+    names = []
+    for i, (_, (book_codes, book_names)) in enumerate(books):
+        codes.extend((key, color, i) for key, color in book_codes)
+        names.extend((key, color, i) for key, color in book_names)
+    return pack_catalog([name for name, _ in books], codes, names)
+
+
+class Table(object):
+    """A sorted table of fixed width keys with their colors and books, read from a catalog."""
+
+    def __init__(self, data, offset):
+        """Read the table at the offset."""
+
+        self.width, self.count = TABLE.unpack_from(data, offset)
+        self.start = offset + TABLE.size
+        colors = self.start + self.width * self.count
+        self.end = colors + 5 * self.count
+        if self.end > len(data):
+            raise ValueError('Truncated Pantone catalog')
+        self.data = data
+        self.colors = array('I')
+        self.colors.frombytes(memoryview(data)[colors:colors + 4 * self.count])
+        if sys.byteorder == 'big':
+            self.colors.byteswap()
+        self.books = memoryview(data)[colors + 4 * self.count:self.end]
+
+    def entries(self):
+        """Iterate the `(key, color, book)` entries."""
+
+        data, width = self.data, self.width
+        for i in range(self.count):
+            offset = self.start + i * width
+            yield data[offset:offset + width].rstrip(b'\0').decode('utf-8'), self.colors[i], self.books[i]
+
+    def book_sizes(self, book):
+        """Get the number of entries of a book and the bytes they take."""
+
+        count = self.books.tobytes().count(bytes([book]))
+        # the key, the color in the data and its copy in `colors`, and the book
+        return count, count * (self.width + 9)
+
+    def get(self, key, ranks):
+        """
+        Get the rank and `0xRRGGBB` color of a normalized key, `None` if it is missing.
+
+        `ranks` holds the rank of every book of the catalog, the entry of the highest
+        ranked book wins and books of rank 0 are skipped.
+        """
+
+        key = key.encode('utf-8')
+        width = self.width
+        if len(key) > width:
+            return None
+        key = key.ljust(width, b'\0')
+        data, start, count = self.data, self.start, self.count
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = start + mid * width
+            if data[offset:offset + width] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        found = None
+        offset = start + lo * width
+        while lo < count and data[offset:offset + width] == key:
+            rank = ranks[self.books[lo]]
+            if rank and (found is None or rank > found[0]):
+                found = (rank, self.colors[lo])
+            lo += 1
+            offset += width
+        return found
+
+
+class Catalog(object):
+    """A compiled catalog of Pantone books."""
+
+    def __init__(self, data):
+        """Read the book names and tables of a catalog."""
+
+        magic, version, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Not a Pantone catalog of version %d' % VERSION)
+        offset = HEADER.size
+        self.books = []
+        for _ in range(count):
+            length, = struct.unpack_from('<H', data, offset)
+            offset += 2
+            self.books.append(bytes(data[offset:offset + length]).decode('utf-8'))
+            offset += length
+        self.codes = Table(data, offset)
+        self.names = Table(data, self.codes.end)
+        self.size = len(data)
+
+    def pack_books(self, books):
+        """Pack a catalog of only the given books of this one, numbered in the given order."""
+
+        numbers = dict((self.books.index(book), i) for i, book in enumerate(books))
+        codes, names = [
+            [(key, color, numbers[book]) for key, color, book in table.entries() if book in numbers]
+            for table in (self.codes, self.names)
+        ]
+        return pack_catalog(books, codes, names)
+
+    def book_sizes(self, book):
+        """Get the number of entries of a book and the bytes they take in both tables."""
+
+        codes, names = self.codes.book_sizes(book), self.names.book_sizes(book)
+        return codes[0] + names[0], codes[1] + names[1]
+
+
+def read_book(name):
+    """Read and parse a JSON book of the books directory."""
+
+    with open(os.path.join(BOOKS_DIR, name), 'rb') as f:
+        return parse_book(f.read())
+
+
+def main():
+    """Compile the JSON books into the catalog next to them."""
+
+    names = sorted(name for name in os.listdir(BOOKS_DIR) if name.endswith('.json'))
+    workers = os.cpu_count() or 1
+    if workers > 1:
+        # parse the books in worker processes, `map` keeps them in order
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers) as pool:
+            books = list(zip(names, pool.map(read_book, names)))
+    else:
+        books = [(name, read_book(name)) for name in names]
+    data = compile_books(books)
+    with open(os.path.join(BOOKS_DIR, CATALOG), 'wb') as f:
+        f.write(data)
+    print('%s: %d books, %d bytes' % (CATALOG, len(books), len(data)))
+
+
+if __name__ == '__main__':
+    main()
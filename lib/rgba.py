@@ -6,7 +6,6 @@ Copyright (c) 2012 - 2016 Isaac Muse <isaacmuse@gmail.com>
 """
 import re
 from colorsys import rgb_to_hls, hls_to_rgb, rgb_to_hsv, hsv_to_rgb
-import decimal
 
 RGB_CHANNEL_SCALE = 1.0 / 255.0
 HUE_SCALE = 1.0 / 360.0
@@ -19,26 +18,87 @@ def clamp(value, mn, mx):
 
 
 def round_int(dec):
-    """Round float to nearest int using expected rounding."""
+    """Round float to nearest int using expected rounding (halves away from zero)."""
 
-    return int(decimal.Decimal(dec).quantize(decimal.Decimal('0'), decimal.ROUND_HALF_UP))
+    if dec < 0:
+        return -round_int(-dec)
+    i = int(dec)
+    # `dec - i` is exact for floats, so this matches rounding the exact binary value
+    return i + 1 if dec - i >= 0.5 else i
+
+
+def pack(r, g, b, a=0xFF):
+    """Pack 8 bit channels into one `0xRRGGBBAA` integer."""
+
+    return r << 24 | g << 16 | b << 8 | a
+
+
+def unpack(color):
+    """Split a packed `0xRRGGBBAA` integer into 8 bit channels."""
+
+    return color >> 24 & 0xFF, color >> 16 & 0xFF, color >> 8 & 0xFF, color & 0xFF
 
 
 class RGBA(object):
-    """RGBA object for converting between color formats or applying filters to the color."""
+    """
+    RGBA object for converting between color formats or applying filters to the color.
+
+    Derived values of the channels, HLS and luminance, are kept until the channels change.
+    """
 
-    r = None
-    g = None
-    b = None
-    a = None
+    __slots__ = ('r', 'g', 'b', 'a', '_key', '_hls', '_luminance')
     color_pattern = re.compile(r"^#(?:([A-Fa-f\d]{6})([A-Fa-f\d]{2})?|([A-Fa-f\d]{3}))")
 
     def __init__(self, s=None):
         """Initialize."""
 
         if s is None:
-            s = "#000000FF"
-        self.r, self.g, self.b, self.a = self._split_channels(s)
+            self.r, self.g, self.b, self.a = 0, 0, 0, 0xFF
+        else:
+            self.r, self.g, self.b, self.a = self._split_channels(s)
+        self._key = None
+
+    @classmethod
+    def from_channels(cls, r, g, b, a=0xFF):
+        """Create a color from 8 bit channels."""
+
+        color = cls.__new__(cls)
+        object.__setattr__(color, 'r', r)
+        object.__setattr__(color, 'g', g)
+        object.__setattr__(color, 'b', b)
+        object.__setattr__(color, 'a', a)
+        object.__setattr__(color, '_key', None)
+        return color
+
+    @classmethod
+    def from_packed(cls, color):
+        """Create a color from a packed `0xRRGGBBAA` integer."""
+
+        return cls.from_channels(*unpack(color))
+
+    def packed(self):
+        """Get the color as a packed `0xRRGGBBAA` integer."""
+
+        return pack(self.r, self.g, self.b, self.a)
+
+    def copy(self):
+        """Get a mutable copy of the color."""
+
+        return RGBA.from_channels(self.r, self.g, self.b, self.a)
+
+    def freeze(self):
+        """Get an immutable copy of the color."""
+
+        return FrozenRGBA.from_channels(self.r, self.g, self.b, self.a)
+
+    def _derived(self):
+        """Drop the derived values when the channels changed since they were computed."""
+
+        key = self.r << 16 | self.g << 8 | self.b
+        if key != self._key:
+            object.__setattr__(self, '_key', key)
+            object.__setattr__(self, '_hls', None)
+            object.__setattr__(self, '_luminance', None)
 
     def _split_channels(self, s):
         """Split the color into color channels: red, green, blue, alpha."""
@@ -93,7 +153,12 @@ class RGBA(object):
     def get_luminance(self):
         """Get percieved luminance."""
 
-        return clamp(round_int(0.299 * self.r + 0.587 * self.g + 0.114 * self.b), 0, 255)
+        self._derived()
+        if self._luminance is None:
+            object.__setattr__(
+                self, '_luminance', clamp(round_int(0.299 * self.r + 0.587 * self.g + 0.114 * self.b), 0, 255)
+            )
+        return self._luminance
 
     def get_true_luminance(self):
         """Get true luminance."""
@@ -144,7 +209,13 @@ class RGBA(object):
     def tohls(self):
         """Convert to HLS color format."""
 
-        return rgb_to_hls(self.r * RGB_CHANNEL_SCALE, self.g * RGB_CHANNEL_SCALE, self.b * RGB_CHANNEL_SCALE)
+        self._derived()
+        if self._hls is None:
+            object.__setattr__(
+                self, '_hls',
+                rgb_to_hls(self.r * RGB_CHANNEL_SCALE, self.g * RGB_CHANNEL_SCALE, self.b * RGB_CHANNEL_SCALE)
+            )
+        return self._hls
 
     def fromhls(self, h, lum, s):
         """Convert to RGB from HSL."""
@@ -308,3 +379,34 @@ class RGBA(object):
             self.r = clamp(round_int(components[0]), 0, 255)
             self.g = clamp(round_int(components[1]), 0, 255)
             self.b = clamp(round_int(components[2]), 0, 255)
+
+
+class FrozenRGBA(RGBA):
+    """An immutable `RGBA`, the filters and conversions that change the channels raise `AttributeError`."""
+
+    __slots__ = ()
+
+    def __init__(self, s=None):
+        """Initialize."""
+
+        r, g, b, a = (0, 0, 0, 0xFF) if s is None else self._split_channels(s)
+        object.__setattr__(self, 'r', r)
+        object.__setattr__(self, 'g', g)
+        object.__setattr__(self, 'b', b)
+        object.__setattr__(self, 'a', a)
+        object.__setattr__(self, '_key', None)
+
+    def __setattr__(self, name, value):
+        """Refuse to change the color."""
+
+        raise AttributeError('FrozenRGBA is immutable')
+
+    def __eq__(self, other):
+        """Compare the channels."""
+
+        return isinstance(other, FrozenRGBA) and self.packed() == other.packed()
+
+    def __hash__(self):
+        """Hash the channels."""
+
+        return hash(self.packed())
@@ -4,59 +4,300 @@ ColorHelper utils
 Copyright (c) 2015 - 2017 Isaac Muse <isaacmuse@gmail.com>
 License: MIT
 """
+import importlib
 import re
-import decimal
-from . import csscolors, pantone, ral
-from .rgba import RGBA, round_int, clamp
+import threading
+from collections import OrderedDict
+from math import copysign
+from .catalog import PENDING
+from .rgba import RGBA, round_int, clamp, pack
 
-FLOAT_TRIM_RE = re.compile(r'^(?P<keep>\d+)(?P<trash>\.0+|(?P<keep2>\.\d*[1-9])0+)$')
+# Translated color of a catalog entry that is not loaded yet
+UNRESOLVED = PENDING
+
+PANTONE_PREFIXES = [
+    'black', 'blue', 'bright red', 'cool gray', 'dark blue', 'green', 'magenta', 'medium purple', 'orange', 'pink',
+    'process blue', 'purple', 'red', 'reflex blue', 'rhodamine red', 'rose gold', 'silver', 'violet', 'warm gray',
+    'warm red', 'yellow'
+]
 
 COLOR_PARTS = {
     "percent": r"[+\-]?(?:(?:\d*\.\d+)|\d+)%",
     "percent_opt": r"[+\-]?(?:(?:\d*\.\d+)|\d+)%?",  # unit is sometimes optional
     "float": r"[+\-]?(?:(?:\d*\.\d+)|\d+)",
-    "deg": r"[+\-]?(?:(?:\d*\.\d+)|\d+)(?:deg)?"  # a float with optional deg unit
+    "deg": r"[+\-]?(?:(?:\d*\.\d+)|\d+)(?:deg)?",  # a float with optional deg unit
+    "pantone_prefixes": '|'.join(PANTONE_PREFIXES)
 }
 
-COMPLETE = r'''
-    (?P<hexa>(\#|0x)(?P<hexa_content>[\dA-Fa-f]{8}))\b |
-    (?P<hex>(\#|0x)(?P<hex_content>[\dA-Fa-f]{6}))\b |
-    (?P<hexa_compressed>(\#|0x)(?P<hexa_compressed_content>[\dA-Fa-f]{4}))\b |
-    (?P<hex_compressed>(\#|0x)(?P<hex_compressed_content>[\dA-Fa-f]{3}))\b |
-    \b(?P<rgb>rgb\(\s*(?P<rgb_content>(?:%(float)s\s*(,\s*)?){2}%(float)s | (?:%(percent)s\s*(,\s*)?){2}%(percent)s)\s*\)) |
-    \b(?P<rgba>rgba\(\s*(?P<rgba_content>
-        (?:%(float)s\s*(,\s*)?){3}(?:%(percent)s|%(float)s) | (?:%(percent)s\s*(,\s*)?){3}(?:%(percent)s|%(float)s)
-    )\s*\)) |
-    \b(?P<hsl>hsl\(\s*(?P<hsl_content>%(deg)s\s*(,\s*)?%(percent_opt)s\s*(,\s*)?%(percent_opt)s)\s*\)) |
-    \b(?P<hsla>hsla\(\s*(?P<hsla_content>%(deg)s\s*(,\s*)?(?:%(percent_opt)s\s*(,\s*)?){2}(?:%(percent)s|%(float)s))\s*\)) |
-    \b(?P<hwb>hwb\(\s*(?P<hwb_content>%(deg)s\s*(,\s*)?%(percent_opt)s\s*(,\s*)?%(percent_opt)s)\s*\)) |
-    \b(?P<hwba>hwb\(\s*(?P<hwba_content>%(deg)s\s*(,\s*)?(?:%(percent_opt)s\s*(,\s*)?){2}(?:%(percent_opt)s|%(float)s))\s*\)) |
-    \b(?P<gray>gray\(\s*(?P<gray_content>%(float)s|%(percent)s)\s*\)) |
-    \b(?P<graya>gray\(\s*(?P<graya_content>(?:%(float)s|%(percent)s)\s*(,\s*)?(?:%(percent)s|%(float)s))\s*\)) |
-    \b(?P<pantone_code>((\d{2}-)?\d{3,5}\s|(black|blue|bright red|cool gray|dark blue|green|magenta|medium purple|orange|pink|process blue|purple|red|reflex blue|rhodamine red|rose gold|silver|violet|warm gray|warm red|yellow)\s(\d{1,5}\s)?|p\s\d{1,3}-\d{1,2}\s)[a-z]{1,3})\b |  # noqa: E501
-    \b(?P<ral_code>RAL\s\d{3,4}(-[0-9A-Z])?(\s\d{2}\s\d{2})?)\b
-''' % COLOR_PARTS
-
-COLOR_NAMES = r'\b(?P<webcolors>%s)\b(?!\()' % '|'.join([name for name in csscolors.name2hex_map.keys()])
+# Patterns of the color format families, in the order they are tried. CSS names are a family
+# too, but they are matched apart from these (see `NAME_RE`).
+FORMAT_PATTERNS = {
+    'hex': r'''
+        (?P<hexa>(\#|0x)(?P<hexa_content>[\dA-Fa-f]{8}))\b |
+        (?P<hex>(\#|0x)(?P<hex_content>[\dA-Fa-f]{6}))\b |
+        (?P<hexa_compressed>(\#|0x)(?P<hexa_compressed_content>[\dA-Fa-f]{4}))\b |
+        (?P<hex_compressed>(\#|0x)(?P<hex_compressed_content>[\dA-Fa-f]{3}))\b
+    ''',
+    'functional': r'''
+        \b(?P<rgb>rgb\(\s*(?P<rgb_content>(?:%(float)s\s*(,\s*)?){2}%(float)s | (?:%(percent)s\s*(,\s*)?){2}%(percent)s)\s*\)) |
+        \b(?P<rgba>rgba\(\s*(?P<rgba_content>
+            (?:%(float)s\s*(,\s*)?){3}(?:%(percent)s|%(float)s) | (?:%(percent)s\s*(,\s*)?){3}(?:%(percent)s|%(float)s)
+        )\s*\)) |
+        \b(?P<hsl>hsl\(\s*(?P<hsl_content>%(deg)s\s*(,\s*)?%(percent_opt)s\s*(,\s*)?%(percent_opt)s)\s*\)) |
+        \b(?P<hsla>hsla\(\s*(?P<hsla_content>%(deg)s\s*(,\s*)?(?:%(percent_opt)s\s*(,\s*)?){2}(?:%(percent)s|%(float)s))\s*\)) |
+        \b(?P<hwb>hwb\(\s*(?P<hwb_content>%(deg)s\s*(,\s*)?%(percent_opt)s\s*(,\s*)?%(percent_opt)s)\s*\)) |
+        \b(?P<hwba>hwb\(\s*(?P<hwba_content>%(deg)s\s*(,\s*)?(?:%(percent_opt)s\s*(,\s*)?){2}(?:%(percent_opt)s|%(float)s))\s*\)) |
+        \b(?P<gray>gray\(\s*(?P<gray_content>%(float)s|%(percent)s)\s*\)) |
+        \b(?P<graya>gray\(\s*(?P<graya_content>(?:%(float)s|%(percent)s)\s*(,\s*)?(?:%(percent)s|%(float)s))\s*\))
+    ''' % COLOR_PARTS,  # noqa: E501
+    'pantone': r'''
+        \b(?P<pantone_code>((\d{2}-)?\d{3,5}\s|(%(pantone_prefixes)s)\s(\d{1,5}\s)?|p\s\d{1,3}-\d{1,2}\s)[a-z]{1,3})\b
+    ''' % COLOR_PARTS,  # noqa: E501
+    'ral': r'''
+        \b(?P<ral_code>RAL\s\d{3,4}(-[0-9A-Z])?(\s\d{2}\s\d{2})?)\b
+    ''',
+}
+ALL_FORMATS = frozenset(FORMAT_PATTERNS) | frozenset(['names'])
 
 HEX_IS_GRAY_RE = re.compile(r'(?i)^#([0-9a-f]{2})\1\1')
 HEX_COMPRESS_RE = re.compile(r'(?i)^#([0-9a-f])\1([0-9a-f])\2([0-9a-f])\3(?:([0-9a-f])\4)?$')
 
-COLOR_RE = re.compile(r'(?x)(?i)(?<![@#$.\-_])(?:%s|%s)(?![@#$.\-_])' % (COMPLETE, COLOR_NAMES))
+color_res = {}
+
+
+def color_re(formats):
+    """Get the compiled color regex for a set of format families, compiling it on first use."""
+
+    pattern = color_res.get(formats)
+    if pattern is None:
+        alternatives = [p for family, p in FORMAT_PATTERNS.items() if family in formats]
+        pattern = color_res[formats] = re.compile(
+            r'(?x)(?i)(?<![@#$.\-_])(?:%s)(?![@#$.\-_])' % '|'.join(alternatives) if alternatives else r'(?!)'
+        )
+    return pattern
+
+
+def __getattr__(name):
+    """Compile `COLOR_RE`, the color regex of every format family, on first use."""
+
+    if name == 'COLOR_RE':
+        return color_re(ALL_FORMATS)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+# Modules of the color catalogs by catalog name
+CATALOG_MODULES = {'names': 'csscolors', 'ral': 'ral', 'pantone': 'pantone'}
+catalogs = {}
+
+
+def catalog(name):
+    """Get a `ColorCatalog`, `names`, `ral` or `pantone`, importing its module on first use."""
+
+    found = catalogs.get(name)
+    if found is None:
+        found = catalogs[name] = importlib.import_module('.' + CATALOG_MODULES[name], __package__).catalog
+    return found
+
+
+# CSS color names are matched apart from `COLOR_RE`: a name always spans a whole word,
+# so finding the words and probing the name map replaces a 148 way alternation at every position.
+NAME_RE = re.compile(r'(?<![@#$.\-_])\b[A-Za-z]{3,20}\b(?![@#$.\-_(])')
+
+# Where a token of each format family can start, with its longest possible length, so a lookup
+# never has to walk back further from the cursor than the longest of them. Functional notations
+# have no fixed length, but can't hold a `)` before their end, so their walk stops at the nearest
+# `)` instead. The start patterns are lookaheads, so overlapping starts are all found.
+TOKEN_STARTS = {
+    'hex': (re.compile(r'(?=#|0x)', re.I), 10),  # 0xRRGGBBAA
+    'functional': (re.compile(r'\b(?=(?:rgba?|hsla?|hwb|gray)\()', re.I), None),
+    'pantone': (re.compile(r'\b(?=\d|p\s|(?:%s)\s)' % '|'.join(PANTONE_PREFIXES), re.I), 23),  # Rhodamine Red 12345 XYZ
+    'ral': (re.compile(r'\b(?=RAL\s)', re.I), 16),  # RAL 1234-M 12 34
+}
+TOKEN_LENGTH = max(length for _, length in TOKEN_STARTS.values() if length)
+NAME_LENGTH = 20  # lightgoldenrodyellow
+
+# A functional color left open at the end of a line, it can go on over the lines after it
+OPEN_FUNCTION_RE = re.compile(r'(?i)\b(?:rgba?|hsla?|hwb|gray)\([^)]*$')
+# How many lines before a line a functional color can be left open on to go on over it
+FUNCTION_LINES = 4
+
+# Every color match holds a `#`, a digit or a color function (hex, functional, Pantone and RAL
+# codes), or starts with one of the candidate words (CSS names and Pantone codes like "Reflex Blue C").
+CANDIDATE_CHAR_RE = re.compile(r'(?i)[#\d]|(?:rgb|hsl|hwb|gray)a?\(')
+CANDIDATE_WORD_RE = re.compile(r'[a-z]+')
+CANDIDATE_WORDS = None  # gathered on first use, to load the CSS names only when needed
+NAMES = None  # the CSS names, gathered on first use for the word scan
+
+
+def has_candidate(text):
+    """Quickly check if the text can hold a color at all."""
+
+    global CANDIDATE_WORDS
+
+    if CANDIDATE_CHAR_RE.search(text) is not None:
+        return True
+    if CANDIDATE_WORDS is None:
+        CANDIDATE_WORDS = (
+            css_names() | frozenset(p.split()[0] for p in PANTONE_PREFIXES)
+        )
+    return not CANDIDATE_WORDS.isdisjoint(CANDIDATE_WORD_RE.findall(text.casefold()))
+
+
+def css_names():
+    """Get the set of CSS names, their membership is probed for every word."""
+
+    global NAMES
+
+    if NAMES is None:
+        NAMES = frozenset(key for key, _ in catalog('names').items())
+    return NAMES
+
+
+class NameMatch(object):
+    """A CSS color name match, shaped like the matches of `COLOR_RE`."""
+
+    lastgroup = 'webcolors'
+
+    def __init__(self, m):
+        """Initialize."""
+
+        self.m = m
+
+    def group(self, name=0):
+        """Get the matched name for group 0 or `webcolors`, `None` for any other group."""
+
+        return self.m.group(0) if name == 0 or name == 'webcolors' else None
+
+    def start(self, group=0):
+        """Get the start of the match."""
+
+        return self.m.start(0)
+
+    def end(self, group=0):
+        """Get the end of the match."""
+
+        return self.m.end(0)
+
+    def span(self, group=0):
+        """Get the start and end of the match."""
+
+        return self.m.span(0)
+
+
+def find_names(text):
+    """Find the CSS color names in the text."""
+
+    names = css_names()
+    for m in NAME_RE.finditer(text):
+        if m.group(0).lower() in names:
+            yield NameMatch(m)
+
+
+def find_color_at(text, ref, formats=ALL_FORMATS):
+    """
+    Find the color match covering the offset.
+
+    Instead of scanning the text from its start, anchored matches are only tried at the places
+    a token of some format family can start, within that family's reach before the offset. They
+    are tried from left to right, skipping starts inside an earlier match, just like a scan would.
+    """
+
+    # Reach back one more token length, so a token that would swallow the first start is seen too
+    lo = max(ref - TOKEN_LENGTH * 2 + 1, 0)
+    starts = set()
+    for family, (start_re, length) in TOKEN_STARTS.items():
+        if family not in formats:
+            continue
+        for s in start_re.finditer(text, lo if length else text.rfind(')', 0, ref) + 1):
+            if s.start() > ref:
+                break
+            starts.add(s.start())
+
+    pattern = color_re(formats)
+    end = 0
+    spans = []
+    for start in sorted(starts):
+        if start < end:
+            continue
+        m = pattern.match(text, start)
+        if m is not None:
+            if ref < m.end():
+                return m
+            end = m.end()
+            spans.append((start, end))
+
+    if 'names' not in formats:
+        return None
+    names = css_names()
+    for m in NAME_RE.finditer(text, max(ref - NAME_LENGTH + 1, 0)):
+        if m.start() > ref:
+            break
+        if ref < m.end():
+            if m.group(0).lower() in names and not any(s < m.end() and m.start() < e for s, e in spans):
+                return NameMatch(m)
+            break
+    return None
+
+
+def split_lines(text, formats=ALL_FORMATS):
+    """
+    Split text into lines, joining a line to the one before when a functional color is left open over it.
+
+    Whether a line is joined only depends on the `FUNCTION_LINES` lines before it, so text split from
+    any line that is not joined is split the same as the whole text.
+    """
+
+    lines = text.split('\n')
+    if 'functional' not in formats or '(' not in text:
+        return lines
+    joined = [lines[0]]
+    for i in range(1, len(lines)):
+        before = '\n'.join(lines[max(i - FUNCTION_LINES, 0):i])
+        if '(' in before and OPEN_FUNCTION_RE.search(before):
+            joined[-1] += '\n' + lines[i]
+        else:
+            joined.append(lines[i])
+    return joined
+
+
+def find_colors(text, formats=ALL_FORMATS):
+    """Find the color matches in the text, skipping the full regex when there can't be any."""
+
+    if not has_candidate(text):
+        return
+    names = find_names(text) if 'names' in formats else iter(())
+    name = next(names, None)
+    for m in color_re(formats).finditer(text):
+        while name is not None and name.end() <= m.start():
+            yield name
+            name = next(names, None)
+        # like the names used to come last in the alternation, any other color wins an overlap
+        while name is not None and name.start() < m.end():
+            name = next(names, None)
+        yield m
+    while name is not None:
+        yield name
+        name = next(names, None)
 
 
 def fmt_float(f, p=0):
     """Set float precision and trim precision zeros."""
 
-    string = str(
-        decimal.Decimal(f).quantize(decimal.Decimal('0.' + ('0' * p) if p > 0 else '0'), decimal.ROUND_HALF_UP)
-    )
-
-    m = FLOAT_TRIM_RE.match(string)
-    if m:
-        string = m.group('keep')
-        if m.group('keep2'):
-            string += m.group('keep2')
+    # Round the exact binary value half up, like quantizing a `Decimal` of it would
+    n, d = f.as_integer_ratio()
+    scale = 10 ** p
+    q, r = divmod(abs(n) * scale, d)
+    if r * 2 >= d:
+        q += 1
+    if p == 0:
+        string = '%d' % q
+    else:
+        whole, frac = divmod(q, scale)
+        string = '%d.%0*d' % (whole, p, frac)
+    if n < 0 or (n == 0 and copysign(1.0, f) < 0):
+        return '-' + string
+    if p > 0:
+        string = string.rstrip('0').rstrip('.')
     return string
 
 
@@ -78,23 +319,38 @@ def compress_hex(color):
     return color
 
 
-def alpha_dec_normalize(dec):
-    """Normalize a decimal alpha value."""
+def alpha_to_8bit(value):
+    """Convert a decimal or percent alpha value to a 0-255 value."""
 
-    temp = float(dec)
-    if temp < 0.0 or temp > 1.0:
-        dec = fmt_float(clamp(float(temp), 0.0, 1.0), 3)
-    alpha = "%02X" % round_int(float(dec) * 255.0)
-    return alpha, dec
+    if value.endswith('%'):
+        alpha = float(value.strip('%')) / 100.0
+    else:
+        alpha = float(value)
+    return round_int(clamp(alpha, 0.0, 1.0) * 255.0)
+
+
+def hex_to_packed(content):
+    """Pack 3, 4, 6 or 8 hex digits (`RGB`, `RGBA`, `RRGGBB` or `RRGGBBAA`) as `0xRRGGBBAA`."""
+
+    value = int(content, 16)
+    size = len(content)
+    if size == 8:
+        return value
+    if size == 6:
+        return value << 8 | 0xFF
+    if size == 3:
+        value = value << 4 | 0xF
+    # compressed digits are doubled
+    return (
+        (value >> 12 & 0xF) * 0x11000000 | (value >> 8 & 0xF) * 0x110000 |
+        (value >> 4 & 0xF) * 0x1100 | (value & 0xF) * 0x11
+    )
 
 
-def alpha_percent_normalize(perc):
-    """Normalize a percent alpha value."""
+def hex_rgb(color):
+    """Format a packed `0xRRGGBBAA` color as `#rrggbb`."""
 
-    alpha_float = clamp(float(perc.strip('%')), 0.0, 100.0) / 100.0
-    alpha_dec = fmt_float(alpha_float, 3)
-    alpha = "%02X" % round_int(alpha_float * 255.0)
-    return alpha, alpha_dec
+    return '#%06x' % (color >> 8)
 
 
 def decode_and_split(data, decode=False):
@@ -126,222 +382,191 @@ def percentage_to_float(value):
     return clamp(float(value.strip('%')), 0.0, 100.0) / 100.0
 
 
-def translate_color(m, use_hex_argb=False, decode=False):
-    """Translate the match object to a color w/ alpha."""
-
-    color = None
-    alpha = None
-    alpha_dec = None
-
-    if m.group('hex_compressed'):
-        content = m.group('hex_compressed_content')
-        if decode:
-            content = m.group('hex_compressed_content').decode('utf-8')
-        color = "#%02x%02x%02x" % (
-            int(content[0:1] * 2, 16), int(content[1:2] * 2, 16), int(content[2:3] * 2, 16)
-        )
+def group_text(m, group, decode=False):
+    """Get the text of a match group, optionally decoding it."""
 
-    elif m.group('hexa_compressed') and use_hex_argb:
-        content = m.group('hexa_compressed_content')
-        if decode:
-            content = m.group('hexa_compressed_content').decode('utf-8')
-        color = "#%02x%02x%02x" % (
-            int(content[1:2] * 2, 16), int(content[2:3] * 2, 16), int(content[3:] * 2, 16)
-        )
-        alpha = content[0:1]
-        alpha_dec = fmt_float(float(int(alpha, 16)) / 255.0, 3)
-
-    elif m.group('hexa_compressed'):
-        content = m.group('hexa_compressed_content')
-        if decode:
-            content = m.group('hexa_compressed_content').decode('utf-8')
-        color = "#%02x%02x%02x" % (
-            int(content[0:1] * 2, 16), int(content[1:2] * 2, 16), int(content[2:3] * 2, 16)
+    content = m.group(group)
+    if decode:
+        content = content.decode('utf-8')
+    return content
+
+
+def hue_to_float(value):
+    """Convert a hue in degrees to a float (0-1)."""
+
+    hue = float(value)
+    if hue < 0.0 or hue > 360.0:
+        hue = hue % 360.0
+    return hue / 360.0
+
+
+def translate_hex(m, use_hex_argb=False, decode=False):
+    """Translate `#RRGGBB` and `#RGB`."""
+
+    return hex_to_packed(group_text(m, m.lastgroup + '_content', decode))
+
+
+def translate_hexa(m, use_hex_argb=False, decode=False):
+    """Translate `#RRGGBBAA` and `#RGBA`, or `#AARRGGBB` and `#ARGB` when `use_hex_argb` is set."""
+
+    color = hex_to_packed(group_text(m, m.lastgroup + '_content', decode))
+    if use_hex_argb:
+        color = (color << 8 | color >> 24) & 0xFFFFFFFF
+    return color
+
+
+def translate_rgb(m, use_hex_argb=False, decode=False):
+    """Translate `rgb()` and `rgba()`."""
+
+    content = decode_and_split(m.group(m.lastgroup + '_content'), decode)
+    try:
+        return pack(
+            string_to_8bit(content[0]),
+            string_to_8bit(content[1]),
+            string_to_8bit(content[2]),
+            alpha_to_8bit(content[3]) if len(content) > 3 else 0xFF
         )
-        alpha = content[3:]
-        alpha_dec = fmt_float(float(int(alpha, 16)) / 255.0, 3)
-
-    elif m.group('hex'):
-        content = m.group('hex_content')
-        if decode:
-            content = m.group('hex_content').decode('utf-8')
-        if len(content) == 6:
-            color = "#%02x%02x%02x" % (
-                int(content[0:2], 16), int(content[2:4], 16), int(content[4:6], 16)
-            )
-        else:
-            color = "#%02x%02x%02x" % (
-                int(content[0:1] * 2, 16), int(content[1:2] * 2, 16), int(content[2:3] * 2, 16)
-            )
-
-    elif m.group('hexa') and use_hex_argb:
-        content = m.group('hexa_content')
-        if decode:
-            content = m.group('hexa_content').decode('utf-8')
-        if len(content) == 8:
-            color = "#%02x%02x%02x" % (
-                int(content[2:4], 16), int(content[4:6], 16), int(content[6:], 16)
-            )
-            alpha = content[0:2]
-            alpha_dec = fmt_float(float(int(alpha, 16)) / 255.0, 3)
-        else:
-            color = "#%02x%02x%02x" % (
-                int(content[1:2] * 2, 16), int(content[2:3] * 2, 16), int(content[3:] * 2, 16)
-            )
-            alpha = content[0:1]
-            alpha_dec = fmt_float(float(int(alpha, 16)) / 255.0, 3)
-
-    elif m.group('hexa'):
-        content = m.group('hexa_content')
-        if decode:
-            content = m.group('hexa_content').decode('utf-8')
-        if len(content) == 8:
-            color = "#%02x%02x%02x" % (
-                int(content[0:2], 16), int(content[2:4], 16), int(content[4:6], 16)
-            )
-            alpha = content[6:]
-            alpha_dec = fmt_float(float(int(alpha, 16)) / 255.0, 3)
-        else:
-            color = "#%02x%02x%02x" % (
-                int(content[0:1] * 2, 16), int(content[1:2] * 2, 16), int(content[2:3] * 2, 16)
-            )
-            alpha = content[3:]
-            alpha_dec = fmt_float(float(int(alpha, 16)) / 255.0, 3)
-
-    elif m.group('rgb'):
-        content = decode_and_split(m.group('rgb_content'), decode)
-        try:
-            color = "#%02x%02x%02x" % (
-                string_to_8bit(content[0]),
-                string_to_8bit(content[1]),
-                string_to_8bit(content[2])
-            )
-        except Exception:
-            color = None
-
-    elif m.group('rgba'):
-        content = decode_and_split(m.group('rgba_content'), decode)
-        try:
-            color = "#%02x%02x%02x" % (
-                string_to_8bit(content[0]),
-                string_to_8bit(content[1]),
-                string_to_8bit(content[2])
-            )
-            if content[3].endswith('%'):
-                alpha, alpha_dec = alpha_percent_normalize(content[3])
-            else:
-                alpha, alpha_dec = alpha_dec_normalize(content[3])
-        except Exception:
-            color = None
-
-    elif m.group('gray'):
-        content = m.group('gray_content')
-        if decode:
-            content = m.group('gray_content').decode('utf-8')
-
-        g = string_to_8bit(content)
-        color = "#%02x%02x%02x" % (g, g, g)
-
-    elif m.group('graya'):
-        content = decode_and_split(m.group('graya_content'), decode)
+    except Exception:
+        return None
+
+
+def translate_gray(m, use_hex_argb=False, decode=False):
+    """Translate `gray()` with or without alpha."""
+
+    content = decode_and_split(m.group(m.lastgroup + '_content'), decode)
+    try:
         g = string_to_8bit(content[0])
-        color = "#%02x%02x%02x" % (g, g, g)
-        if content[1].endswith('%'):
-            alpha, alpha_dec = alpha_percent_normalize(content[1])
-        else:
-            alpha, alpha_dec = alpha_dec_normalize(content[1])
-
-    elif m.group('hsl'):
-        content = decode_and_split(m.group('hsl_content'), decode)
-        try:
-            rgba = RGBA()
-            hue = float(content[0])
-            if hue < 0.0 or hue > 360.0:
-                hue = hue % 360.0
-            h = hue / 360.0
-            s = percentage_to_float(content[1])
-            lum = percentage_to_float(content[2])
-            rgba.fromhls(h, lum, s)
-            color = rgba.get_rgb()
-        except Exception:
-            color = None
-
-    elif m.group('hsla'):
-        content = decode_and_split(m.group('hsla_content'), decode)
-        try:
-            rgba = RGBA()
-            hue = float(content[0])
-            if hue < 0.0 or hue > 360.0:
-                hue = hue % 360.0
-            h = hue / 360.0
-            s = percentage_to_float(content[1])
-            lum = percentage_to_float(content[2])
-            rgba.fromhls(h, lum, s)
-            color = rgba.get_rgb()
-            if content[3].endswith('%'):
-                alpha, alpha_dec = alpha_percent_normalize(content[3])
-            else:
-                alpha, alpha_dec = alpha_dec_normalize(content[3])
-        except Exception:
-            color = None
-
-    elif m.group('hwb'):
-        content = decode_and_split(m.group('hwb_content'), decode)
-        try:
-            rgba = RGBA()
-            hue = float(content[0])
-            if hue < 0.0 or hue > 360.0:
-                hue = hue % 360.0
-            h = hue / 360.0
-            w = percentage_to_float(content[1])
-            b = percentage_to_float(content[2])
-            rgba.fromhwb(h, w, b)
-            color = rgba.get_rgb()
-        except Exception:
-            color = None
-
-    elif m.group('hwba'):
-        content = decode_and_split(m.group('hwba_content'), decode)
-        try:
-            rgba = RGBA()
-            hue = float(content[0])
-            if hue < 0.0 or hue > 360.0:
-                hue = hue % 360.0
-            h = hue / 360.0
-            w = percentage_to_float(content[1])
-            b = percentage_to_float(content[2])
-            rgba.fromhwb(h, w, b)
-            color = rgba.get_rgb()
-            if content[3].endswith('%'):
-                alpha, alpha_dec = alpha_percent_normalize(content[3])
-            else:
-                alpha, alpha_dec = alpha_dec_normalize(content[3])
-        except Exception:
-            color = None
-
-    elif m.group('webcolors'):
-        try:
-            if decode:
-                color = csscolors.name2hex(m.group('webcolors').decode('utf-8')).lower()
-            else:
-                color = csscolors.name2hex(m.group('webcolors')).lower()
-        except Exception:
-            pass
-    elif m.group('pantone_code'):
-        try:
-            if decode:
-                color = pantone.code2hex(m.group('pantone_code').decode('utf-8')).lower()
-            else:
-                color = pantone.code2hex(m.group('pantone_code')).lower()
-        except Exception:
-            pass
-    elif m.group('ral_code'):
-        try:
-            if decode:
-                color = ral.code2hex(m.group('ral_code').decode('utf-8')).lower()
-            else:
-                color = ral.code2hex(m.group('ral_code')).lower()
-        except Exception:
-            pass
-
-    return color, alpha, alpha_dec
+        return pack(g, g, g, alpha_to_8bit(content[1]) if len(content) > 1 else 0xFF)
+    except Exception:
+        return None
+
+
+def translate_hsl(m, use_hex_argb=False, decode=False):
+    """Translate `hsl()` and `hsla()`."""
+
+    content = decode_and_split(m.group(m.lastgroup + '_content'), decode)
+    try:
+        rgba = RGBA.from_channels(0, 0, 0, alpha_to_8bit(content[3]) if len(content) > 3 else 0xFF)
+        rgba.fromhls(hue_to_float(content[0]), percentage_to_float(content[2]), percentage_to_float(content[1]))
+        return rgba.packed()
+    except Exception:
+        return None
+
+
+def translate_hwb(m, use_hex_argb=False, decode=False):
+    """Translate `hwb()` with or without alpha."""
+
+    content = decode_and_split(m.group(m.lastgroup + '_content'), decode)
+    try:
+        rgba = RGBA.from_channels(0, 0, 0, alpha_to_8bit(content[3]) if len(content) > 3 else 0xFF)
+        rgba.fromhwb(hue_to_float(content[0]), percentage_to_float(content[1]), percentage_to_float(content[2]))
+        return rgba.packed()
+    except Exception:
+        return None
+
+
+def catalog_translator(name):
+    """Create a translator that looks the matched text up in a color catalog."""
+
+    def translate(m, use_hex_argb=False, decode=False):
+        """Translate a color name or code."""
+
+        color = catalog(name).get(group_text(m, m.lastgroup, decode))
+        if color is None or color is UNRESOLVED:
+            return color
+        return color << 8 | 0xFF
+
+    return translate
+
+
+# Translators by the name of the top level group a color matched
+TRANSLATORS = {
+    'hex': translate_hex,
+    'hex_compressed': translate_hex,
+    'hexa': translate_hexa,
+    'hexa_compressed': translate_hexa,
+    'rgb': translate_rgb,
+    'rgba': translate_rgb,
+    'gray': translate_gray,
+    'graya': translate_gray,
+    'hsl': translate_hsl,
+    'hsla': translate_hsl,
+    'hwb': translate_hwb,
+    'hwba': translate_hwb,
+    'pantone_code': catalog_translator('pantone'),
+    'ral_code': catalog_translator('ral'),
+    'webcolors': catalog_translator('names'),
+}
+
+
+class LRUCache(object):
+    """A bounded least recently used cache with hit and miss counters."""
+
+    def __init__(self, size):
+        """Initialize."""
+
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Get a cached value, marking it as recently used."""
+
+        with self.lock:
+            try:
+                value = self.data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Cache a value, dropping the least recently used ones beyond the size."""
+
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.size:
+                self.data.popitem(last=False)
+
+    def resize(self, size):
+        """Change the size, dropping the least recently used values that no longer fit."""
+
+        with self.lock:
+            self.size = max(size, 0)
+            while len(self.data) > self.size:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        """Drop all values and reset the counters."""
+
+        with self.lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Translated colors by matched text and `use_hex_argb`
+color_cache = LRUCache(1024)
+MISSING = object()
+
+
+def translate_color(m, use_hex_argb=False, decode=False):
+    """
+    Translate the match object to a packed `0xRRGGBBAA` color, `None` if it has no known color.
+
+    Returns `UNRESOLVED` when the color is in a catalog that is still loading.
+    """
+
+    key = (m.group(0), use_hex_argb)
+    color = color_cache.get(key, MISSING)
+    if color is MISSING:
+        translator = TRANSLATORS.get(m.lastgroup)
+        color = None if translator is None else translator(m, use_hex_argb, decode)
+        if color is not UNRESOLVED:
+            color_cache.put(key, color)
+    return color
@@ -0,0 +1,137 @@
+"""
+Color translation benchmarks.
+
+Times the translator of every format family and the `has_candidate`
+prefilter of the color scan, outside of Sublime Text:
+
+    python tests/bench_translate.py [--number N]
+
+Translators are timed on their own, without the color cache, and through
+`translate_color` with the cache warm. Pantone codes need Sublime Text to
+load their books, they are skipped when it is missing. The prefilter is
+timed on 100 character windows around random cursor positions in the
+files of the package, against the same scan without it.
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lib import util  # noqa: E402
+
+# A literal of every translator group, in the order the translators used to be tried
+SAMPLES = [
+    ('hex_compressed', '#f0a'),
+    ('hexa_compressed', '#f0a8'),
+    ('hex', '#ff00aa'),
+    ('hexa', '#ff00aa80'),
+    ('rgb', 'rgb(255, 0, 170)'),
+    ('rgba', 'rgba(255, 0, 170, 0.5)'),
+    ('gray', 'gray(50%)'),
+    ('graya', 'gray(50%, 0.5)'),
+    ('hsl', 'hsl(320, 100%, 50%)'),
+    ('hsla', 'hsla(320, 100%, 50%, 0.5)'),
+    ('hwb', 'hwb(320, 0%, 0%)'),
+    ('hwba', 'hwb(320, 0%, 0%, 0.5)'),
+    ('pantone_code', '16-1546 TCX'),
+    ('ral_code', 'RAL 1000'),
+    ('webcolors', 'rebeccapurple'),
+]
+
+# Files to take the prefilter windows from, as prose and as code
+WINDOW_FILES = [('prose', 'README.md'), ('code', 'ColorHints.py')]
+WINDOW_SIZE = 100
+WINDOWS = 2000
+
+
+def match(group, text):
+    """Get the match of a literal, checking it matches whole as the expected group."""
+
+    m = next(util.find_colors(text), None)
+    if m is None or m.lastgroup != group or m.group(0) != text:
+        raise ValueError('%r does not match as %s' % (text, group))
+    return m
+
+
+def per_call(fn, number):
+    """Get the microseconds a call takes, the best of 5 runs."""
+
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def bench_translators(number):
+    """Time the translator of every format family, alone and through the color cache."""
+
+    print('%-16s %-26s %10s %10s' % ('group', 'literal', 'translate', 'cached'))
+    for group, text in SAMPLES:
+        m = match(group, text)
+        translator = util.TRANSLATORS[group]
+        try:
+            translator(m)
+        except ImportError:
+            print('%-16s %-26s %10s' % (group, text, 'skipped, needs Sublime Text'))
+            continue
+        util.translate_color(m)
+        print('%-16s %-26s %10.2f %10.2f' % (
+            group, text, per_call(lambda: translator(m), number), per_call(lambda: util.translate_color(m), number)
+        ))
+    print('(microseconds per call)')
+
+
+def scan_all(text):
+    """Run the color regex and the name scan `find_colors` runs, without the prefilter."""
+
+    return list(util.color_re(util.ALL_FORMATS).finditer(text)), list(util.find_names(text))
+
+
+def scan_filtered(text):
+    """Scan text with `find_colors`."""
+
+    return list(util.find_colors(text))
+
+
+def bench_prefilter(number):
+    """Time the color scan of windows around random cursor positions, with and without the prefilter."""
+
+    rand = random.Random(0)
+    print('%-8s %-16s %10s %10s %9s' % ('text', 'file', 'no filter', 'filter', 'rejected'))
+    for kind, name in WINDOW_FILES:
+        with open(os.path.join(ROOT, name), encoding='utf-8') as f:
+            text = f.read()
+        windows = []
+        for _ in range(WINDOWS):
+            point = rand.randrange(len(text))
+            windows.append(text[max(point - WINDOW_SIZE // 2, 0):point + WINDOW_SIZE // 2])
+        rejected = [window for window in windows if not util.has_candidate(window)]
+        for window in rejected:
+            if scan_all(window) != ([], []):
+                raise ValueError('the prefilter rejects colors in %r' % window)
+        runs = max(number // WINDOWS, 1)
+        print('%-8s %-16s %10.2f %10.2f %8.0f%%' % (
+            kind, name,
+            per_call(lambda: [scan_all(window) for window in windows], runs) / WINDOWS,
+            per_call(lambda: [scan_filtered(window) for window in windows], runs) / WINDOWS,
+            len(rejected) * 100.0 / WINDOWS
+        ))
+    print('(microseconds per %d character window)' % WINDOW_SIZE)
+
+
+def main():
+    """Run the benchmarks."""
+
+    parser = argparse.ArgumentParser(description='Benchmark color translation and the color scan prefilter.')
+    parser.add_argument('--number', type=int, default=20000, help='calls per timing run')
+    args = parser.parse_args()
+    print('Python %s' % sys.version.split()[0])
+    print()
+    bench_translators(args.number)
+    print()
+    bench_prefilter(args.number)
+
+
+if __name__ == '__main__':
+    main()